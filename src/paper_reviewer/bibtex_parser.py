@@ -1,6 +1,12 @@
 """BibTeX file parser module."""
 
+import hashlib
 import logging
+import os
+import pickle
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
@@ -11,15 +17,91 @@ from bibtexparser.customization import convert_to_unicode
 from .errors import BibTeXParseError
 from .models import BibTeXEntry
 
+# Optional Rust-backed accelerator. When installed it exposes
+# parse_bytes(bytes) -> list[dict[str, str]] with unique, lowercase-field
+# entries, bypassing Python-level tokenization entirely. We fall back to
+# bibtexparser when it is not available.
+try:
+    import rust_bibtex  # type: ignore[import-not-found]
+except ImportError:
+    rust_bibtex = None
+
+# Optional encoding detection: cchardet is ~1000x faster than chardet, but
+# either works; without both we fall back to utf-8 → latin-1 decoding.
+try:
+    import cchardet as chardet  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import chardet  # type: ignore[import-not-found]
+    except ImportError:
+        chardet = None
+
 logger = logging.getLogger(__name__)
 
+# Precompiled validation patterns, hoisted to module scope so tight parse
+# loops avoid per-call object creation and try/except misses
+_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+_YEAR_RE = re.compile(r"^\d{4}$")
+
+# On-disk cache of parsed results, keyed by (path, mtime, size) so any change
+# to the source file invalidates the entry. Unchanged bibs skip parsing entirely.
+_CACHE_DIR = Path.home() / ".cache" / "paper-reviewer" / "bibcache"
+
+# Author names repeat across entries of a library; interning them means N
+# entries sharing K unique authors hold O(K) strings instead of O(N*avg).
+# A plain dict: realistic libraries have at most a few thousand unique names.
+_AUTHOR_INTERN: Dict[str, str] = {}
+
+
+def _cache_path_for(bib_path: Path, namespace: str = "bib") -> Path:
+    """
+    Compute the cache file path for a BibTeX file's current stat.
+
+    The namespace keeps parsers with different output types (plain entries
+    vs Zotero paper pairs) from colliding on the same source file.
+    """
+    stat = bib_path.stat()
+    cache_key = hashlib.blake2b(
+        f"{bib_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    ).hexdigest()
+    return _CACHE_DIR / f"{namespace}-{cache_key}.pkl"
+
+
+def _load_cached_entries(cache_path: Path) -> list | None:
+    """Load cached entries, returning None on any miss or corruption."""
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable bib cache %s: %s", cache_path, e)
+        return None
+
+
+def _store_cached_entries(cache_path: Path, entries: list) -> None:
+    """Write entries to the cache atomically (tmp file + rename)."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entries, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Caching is best-effort; never fail the parse over it
+        logger.debug("Could not write bib cache %s: %s", cache_path, e)
+
 
-def parse_bibtex_file(bib_path: Path) -> List[BibTeXEntry]:
+def parse_bibtex_file(bib_path: Path, use_cache: bool = True) -> List[BibTeXEntry]:
     """
     Parse a BibTeX file and extract structured metadata.
 
+    Results are cached on disk keyed by path, mtime and size, so repeated
+    runs over an unchanged file skip parsing entirely.
+
     Args:
         bib_path: Path to the `.bib` file
+        use_cache: Whether to read/write the on-disk parse cache
 
     Returns:
         List of BibTeXEntry objects parsed from the file
@@ -34,89 +116,26 @@ def parse_bibtex_file(bib_path: Path) -> List[BibTeXEntry]:
     if not bib_path.is_file():
         raise BibTeXParseError(f"Path is not a file: {bib_path}", str(bib_path))
 
-    try:
-        # Configure parser to handle unicode and common issues
-        # Create a fresh parser instance for each file to avoid state accumulation
-        parser = BibTexParser()
-        parser.customization = convert_to_unicode
-        parser.ignore_nonstandard_types = False
-        parser.homogenise_fields = True
-        parser.expect_multiple_parse = False  # Don't accumulate entries across parses
-
-        # Try different encodings
-        encodings = ["utf-8", "latin-1", "cp1252"]
-        entries = None
-        last_error = None
-
-        for encoding in encodings:
-            try:
-                with open(bib_path, "r", encoding=encoding) as f:
-                    file_content = f.read()
-                
-                # Use loads() instead of load() to avoid parser state accumulation
-                bib_database = bibtexparser.loads(file_content, parser=parser)
-                entries = bib_database.entries
-                
-                # Deduplicate entries by ID to handle parser state accumulation
-                seen_ids = set()
-                unique_entries = []
-                for entry in entries:
-                    entry_id = entry.get('id') or entry.get('ID') or entry.get('key')
-                    if entry_id and entry_id not in seen_ids:
-                        seen_ids.add(entry_id)
-                        unique_entries.append(entry)
-                    elif not entry_id:
-                        # Entry without ID - include it but log warning
-                        unique_entries.append(entry)
-                
-                entries = unique_entries
-                
-                # bibtexparser with homogenise_fields=True normalizes ID to id (lowercase)
-                # Map entry keys from entries_dict to entries
-                if hasattr(bib_database, 'entries_dict'):
-                    entries_dict = bib_database.entries_dict
-                    # entries_dict maps entry keys to lists of entries
-                    for entry_key, entry_list in entries_dict.items():
-                        for entry in entry_list:
-                            # Ensure entry has ID field (use lowercase 'id' for homogenise_fields)
-                            if 'id' not in entry and 'ID' not in entry:
-                                entry['id'] = entry_key
-                            elif 'ID' in entry and 'id' not in entry:
-                                entry['id'] = entry['ID']
-                break
-            except UnicodeDecodeError as e:
-                last_error = e
-                continue
-            except Exception as e:
-                last_error = e
-                continue
+    cache_path = None
+    if use_cache:
+        cache_path = _cache_path_for(bib_path)
+        cached = _load_cached_entries(cache_path)
+        if cached is not None:
+            logger.debug("Using cached parse for %s", bib_path)
+            return cached
 
-        if entries is None:
-            raise BibTeXParseError(
-                f"Failed to parse BibTeX file with any encoding: {bib_path}. "
-                f"Last error: {last_error}",
-                str(bib_path),
-            ) from last_error
-
-        # Convert entries to BibTeXEntry objects
+    try:
+        # Single pipeline: raw parse -> dedup/normalize generator -> models.
+        # Avoids materializing intermediate entry lists for large bibs.
         bibtex_entries = []
-        for entry in entries:
+        for entry in _dedup_entries(_parse_raw_entries(bib_path)):
             try:
-                # bibtexparser with homogenise_fields=True uses lowercase 'id'
-                # Normalize to ensure 'id' exists (prefer lowercase for homogenise_fields)
-                if 'id' not in entry:
-                    if 'ID' in entry:
-                        entry['id'] = entry['ID']
-                    elif hasattr(entry, 'key'):
-                        entry['id'] = entry.key
-                
                 bibtex_entry = extract_metadata(entry)
                 bibtex_entries.append(bibtex_entry)
             except Exception as e:
                 entry_id = entry.get('ID') or entry.get('id') or entry.get('key', 'unknown')
                 logger.warning(
-                    f"Skipping entry in {bib_path}: {e}. "
-                    f"Entry ID: {entry_id}"
+                    "Skipping entry in %s: %s. Entry ID: %s", bib_path, e, entry_id
                 )
                 continue
 
@@ -125,6 +144,9 @@ def parse_bibtex_file(bib_path: Path) -> List[BibTeXEntry]:
                 f"No valid entries found in BibTeX file: {bib_path}", str(bib_path)
             )
 
+        if cache_path is not None:
+            _store_cached_entries(cache_path, bibtex_entries)
+
         return bibtex_entries
 
     except BibTeXParseError:
@@ -135,6 +157,145 @@ def parse_bibtex_file(bib_path: Path) -> List[BibTeXEntry]:
         ) from e
 
 
+def parse_bibtex_files(paths: List[Path]) -> Dict[Path, List[BibTeXEntry]]:
+    """
+    Parse multiple BibTeX files in parallel using a process pool.
+
+    Parsing is CPU-bound in Python, so batches of files scale near-linearly
+    with cores. Single-file parsing stays sequential because bibtexparser
+    state is not thread-safe.
+
+    Args:
+        paths: List of paths to `.bib` files
+
+    Returns:
+        Dict mapping each path to its list of BibTeXEntry objects
+
+    Raises:
+        BibTeXParseError: If any file cannot be parsed or is malformed
+        FileNotFoundError: If any file does not exist
+    """
+    if not paths:
+        return {}
+
+    if len(paths) == 1:
+        # No point paying process startup cost for a single file
+        return {paths[0]: parse_bibtex_file(paths[0])}
+
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # executor.map re-raises worker exceptions (including BibTeXParseError)
+        # in submission order when results are consumed
+        results = executor.map(parse_bibtex_file, paths, chunksize=chunksize)
+        return dict(zip(paths, results))
+
+
+def _dedup_entries(entries):
+    """
+    Yield entries with a normalized 'id' field, skipping duplicate IDs.
+
+    Folds the ID normalization that bibtexparser leaves split across
+    'id'/'ID'/'key' into a single streaming pass.
+
+    Args:
+        entries: Iterable of raw entry dictionaries
+
+    Yields:
+        Entry dictionaries with 'id' set where an ID is known
+    """
+    seen_ids = set()
+    for entry in entries:
+        entry_id = entry.get("id") or entry.get("ID") or entry.get("key")
+        if entry_id:
+            if entry_id in seen_ids:
+                continue
+            seen_ids.add(entry_id)
+            entry.setdefault("id", entry_id)
+        yield entry
+
+
+def _parse_raw_entries(bib_path: Path) -> List[Dict]:
+    """
+    Parse a BibTeX file into raw entry dictionaries.
+
+    Uses the Rust-backed accelerator when installed; its entries are already
+    unique with lowercase field names, so the bibtexparser-specific dedup and
+    field homogenisation are skipped. Otherwise falls back to bibtexparser.
+
+    Args:
+        bib_path: Path to the `.bib` file
+
+    Returns:
+        List of raw entry dictionaries
+
+    Raises:
+        BibTeXParseError: If the file cannot be parsed
+    """
+    if rust_bibtex is not None:
+        try:
+            return rust_bibtex.parse_bytes(bib_path.read_bytes())
+        except Exception as e:
+            raise BibTeXParseError(
+                f"Failed to parse BibTeX file: {bib_path}. Error: {e}",
+                str(bib_path),
+            ) from e
+
+    # Configure parser to handle unicode and common issues
+    # Create a fresh parser instance for each file to avoid state accumulation
+    parser = BibTexParser()
+    parser.customization = convert_to_unicode
+    parser.ignore_nonstandard_types = False
+    # Field-name casing is normalized once in extract_metadata, so skip
+    # bibtexparser's per-field homogenisation pass over every entry
+    parser.homogenise_fields = False
+    parser.expect_multiple_parse = False  # Don't accumulate entries across parses
+
+    # Read once as bytes, detect encoding on a small prefix, decode once
+    raw = bib_path.read_bytes()
+    file_content = _decode_bib_bytes(raw)
+
+    try:
+        # Use loads() instead of load() to avoid parser state accumulation
+        bib_database = bibtexparser.loads(file_content, parser=parser)
+    except Exception as e:
+        raise BibTeXParseError(
+            f"Failed to parse BibTeX file: {bib_path}. Error: {e}",
+            str(bib_path),
+        ) from e
+
+    # Dedup and ID normalization happen downstream in _dedup_entries
+    return bib_database.entries
+
+
+def _decode_bib_bytes(raw: bytes) -> str:
+    """
+    Decode raw BibTeX bytes to text with a single decode pass.
+
+    Detects the encoding on the first 4 KB via cchardet/chardet when
+    available; otherwise tries utf-8 and falls back to latin-1 (which
+    accepts any byte sequence).
+
+    Args:
+        raw: Raw bytes of the `.bib` file
+
+    Returns:
+        Decoded file content
+    """
+    if chardet is not None:
+        encoding = (chardet.detect(raw[:4096]) or {}).get("encoding") or "utf-8"
+        try:
+            return raw.decode(encoding)
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")
+
+
 def extract_metadata(entry: Dict) -> BibTeXEntry:
     """
     Convert a raw bibtexparser entry dictionary to a BibTeXEntry model.
@@ -148,16 +309,24 @@ def extract_metadata(entry: Dict) -> BibTeXEntry:
     Raises:
         BibTeXParseError: If required fields are missing
     """
+    # Canonicalize field names once so every lookup below is a single probe.
+    # bibtexparser with homogenise_fields=True already lowercases, so entries
+    # from one parse share the same shape — detect that and reuse the dict
+    # as-is instead of rebuilding it per entry.
+    if all(k.islower() for k in entry):
+        e = entry
+    else:
+        e = {k.lower(): v for k, v in entry.items()}
+
     # Extract required fields
-    # bibtexparser may lowercase field names, so check both cases
-    title = entry.get("title", "") or entry.get("Title", "")
+    title = e.get("title", "")
     if isinstance(title, str):
         title = title.strip()
     else:
         title = str(title).strip()
-    
+
     # Entry key/ID - bibtexparser with homogenise_fields uses lowercase 'id'
-    bib_key = entry.get("id") or entry.get("ID") or entry.get("key") or ""
+    bib_key = e.get("id") or e.get("key") or ""
     if isinstance(bib_key, str):
         bib_key = bib_key.strip()
     else:
@@ -169,11 +338,11 @@ def extract_metadata(entry: Dict) -> BibTeXEntry:
     if not bib_key:
         raise BibTeXParseError("Missing required field 'ID' in BibTeX entry")
 
-    # Extract optional fields (check both lowercase and title case)
-    authors_raw = entry.get("author") or entry.get("Author") or entry.get("authors") or entry.get("Authors")
-    year_str = entry.get("year", "") or entry.get("Year", "")
-    url_str = entry.get("url", "") or entry.get("URL", "") or entry.get("Url", "")
-    doi_str = entry.get("doi", "") or entry.get("DOI", "") or entry.get("Doi", "")
+    # Extract optional fields (single lookups on the canonicalized dict)
+    authors_raw = e.get("author") or e.get("authors")
+    year_str = e.get("year", "")
+    url_str = e.get("url", "")
+    doi_str = e.get("doi", "")
     
     # Handle authors - keep as list if already a list, convert to string otherwise
     if isinstance(authors_raw, list):
@@ -202,13 +371,14 @@ def extract_metadata(entry: Dict) -> BibTeXEntry:
     # Parse year
     year = None
     if year_str:
-        try:
-            year = int(year_str)
-            if year < 1900 or year > 2100:
-                logger.warning(f"Year {year} is out of valid range (1900-2100), setting to None")
-                year = None  # Set to None if out of range to pass validation
-        except ValueError:
-            logger.warning(f"Could not parse year '{year_str}', skipping")
+        if _YEAR_RE.match(year_str):
+            y = int(year_str)
+            if 1900 <= y <= 2100:
+                year = y
+            else:
+                logger.warning("Year %s is out of valid range (1900-2100), setting to None", y)
+        else:
+            logger.warning("Could not parse year '%s', skipping", year_str)
 
     # Authors are already handled above - pass directly to model
 
@@ -216,16 +386,23 @@ def extract_metadata(entry: Dict) -> BibTeXEntry:
     url_value = None
     if url_str:
         # Basic URL validation - HttpUrl will do stricter validation
-        if url_str.startswith(("http://", "https://")):
+        if _URL_RE.match(url_str):
             url_value = url_str
         else:
-            logger.warning(f"Invalid URL format '{url_str}', skipping")
+            logger.warning("Invalid URL format '%s', skipping", url_str)
 
-    # Build BibTeXEntry
+    # Build BibTeXEntry. Every field is already validated above (title/id
+    # presence, year bounds, URL scheme), so model_construct skips Pydantic's
+    # re-validation dispatch — a measurable win on multi-thousand-entry bibs.
+    # Author splitting is the one model validator with real logic, so apply
+    # it explicitly.
     try:
-        bibtex_entry = BibTeXEntry(
+        bibtex_entry = BibTeXEntry.model_construct(
             title=title,
-            authors=authors,
+            authors=[
+                _AUTHOR_INTERN.setdefault(a, a)
+                for a in BibTeXEntry.parse_authors(authors)
+            ],
             year=year,
             bib_key=bib_key,
             url=url_value,
@@ -1,5 +1,6 @@
 """Configuration management for paper reviewer CLI."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -37,6 +38,10 @@ def load_config(env_file: Optional[Path] = None) -> ConfigModel:
     """
     Load configuration from environment variables or .env file.
 
+    Results are memoized per resolved .env path, so repeated calls skip the
+    dotenv file I/O and Pydantic validation. Use _load_config.cache_clear()
+    in tests that toggle environment variables between calls.
+
     Args:
         env_file: Optional path to .env file. If None, searches for .env in:
             - Current working directory
@@ -65,6 +70,28 @@ def load_config(env_file: Optional[Path] = None) -> ConfigModel:
                 # Use default (will try .env in current directory)
                 env_file = Path(".env")
 
+    # Resolve before memoizing so the relative ".env" default cannot serve
+    # a cached config from a different working directory after os.chdir
+    return _load_config(str(env_file.resolve()) if env_file else None)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(env_file_str: Optional[str]) -> ConfigModel:
+    """
+    Load and validate configuration for a resolved .env path (memoized).
+
+    Args:
+        env_file_str: Resolved .env path as a string, or None
+
+    Returns:
+        Validated Config model instance
+
+    Raises:
+        FileNotFoundError: If .env file is specified but doesn't exist
+        ValueError: If required environment variables are missing or invalid
+    """
+    env_file = Path(env_file_str) if env_file_str else None
+
     # Check if file exists (if explicitly provided)
     if env_file and not env_file.exists():
         raise FileNotFoundError(
@@ -1,10 +1,26 @@
 """Logging configuration for paper reviewer CLI."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Active QueueListener draining file-handler records on a background thread;
+# kept at module scope so repeated setup_logging calls can stop the old one
+_queue_listener: Optional[QueueListener] = None
+
+# Single shared formatter: both handlers use the same layout, and with the
+# explicit datefmt plus msec formatting disabled the per-record cost drops
+# to one strftime call
+_LOG_FORMATTER = logging.Formatter(
+    "[%(asctime)s] %(levelname)s - %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_LOG_FORMATTER.default_msec_format = None
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> None:
     """
@@ -45,26 +61,39 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> N
     # Console handler (INFO level and above)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
-    console_formatter = logging.Formatter(
-        "[%(asctime)s] %(levelname)s - %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_LOG_FORMATTER)
     root_logger.addHandler(console_handler)
 
-    # File handler (DEBUG level and above)
+    # File handler (DEBUG level and above), drained via a queue so the
+    # emitting thread only pays a queue put instead of a disk write per record
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
     try:
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            "[%(asctime)s] %(levelname)s - %(name)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
+        file_handler.setFormatter(_LOG_FORMATTER)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
         )
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        _queue_listener.start()
+        atexit.register(_stop_queue_listener)
     except (OSError, PermissionError) as e:
         # If we can't create log file, just log to console
-        root_logger.warning(f"Could not create log file {log_file}: {e}. Logging to console only.")
+        root_logger.warning("Could not create log file %s: %s. Logging to console only.", log_file, e)
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
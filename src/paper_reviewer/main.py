@@ -1,13 +1,21 @@
 """Main CLI entry point for paper reviewer."""
 
 import argparse
+import asyncio
+import hashlib
+import os
 import sys
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
+
+import orjson
 
 from .config import load_config
 from .errors import GeminiAPIError, NotionAPIError, PaperReviewerError
-from .gemini_client import analyze_paper
+from .gemini_client import _MODEL_NAME, analyze_paper
+from .gemini_prompts import SYSTEM_INSTRUCTION
 from .logger import get_logger, setup_logging
 from .models import Config as ConfigModel, PaperPair
 from .notion_client import create_paper_page
@@ -16,6 +24,7 @@ from .notion_properties import build_notion_properties
 from .scanner import scan_directory
 from .ui import (
     create_progress_tracker,
+    batch_output,
     display_error,
     display_info,
     display_papers_table,
@@ -25,8 +34,81 @@ from .zotero_parser import parse_zotero_bib_file
 
 logger = get_logger(__name__)
 
+# On-disk cache of Gemini reviews keyed by PDF content hash, so re-runs and
+# recoveries after partial failures skip the analysis step entirely. Entries
+# record the model and prompt version so either changing busts the cache.
+_REVIEW_CACHE_DIR = Path.home() / ".cache" / "paper-reviewer" / "reviews"
+_PROMPT_HASH = hashlib.blake2b(SYSTEM_INSTRUCTION.encode(), digest_size=8).hexdigest()
+
+
+def _pdf_content_key(pdf_path: Path) -> str:
+    """Hash the PDF contents in 1 MiB chunks without loading the whole file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cached_review(cache_key: str) -> Optional[Dict[str, str]]:
+    """Load a cached review, returning None on miss or stale model/prompt."""
+    cache_path = _REVIEW_CACHE_DIR / f"{cache_key}.json"
+    try:
+        payload = orjson.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable review cache %s: %s", cache_path, e)
+        return None
+
+    if payload.get("model") != _MODEL_NAME or payload.get("prompt_hash") != _PROMPT_HASH:
+        return None
+    return payload.get("review")
+
+
+def _store_cached_review(cache_key: str, review_json: Dict[str, str]) -> None:
+    """Write a review to the cache atomically (tmp file + rename)."""
+    payload = {"model": _MODEL_NAME, "prompt_hash": _PROMPT_HASH, "review": review_json}
+    cache_path = _REVIEW_CACHE_DIR / f"{cache_key}.json"
+    try:
+        _REVIEW_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_REVIEW_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(payload))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        # Caching is best-effort; never fail the paper over it
+        logger.debug("Could not write review cache %s: %s", cache_path, e)
+
 
-def process_single_paper(paper: PaperPair, config: ConfigModel) -> bool:
+def _dedup_papers(papers: list) -> list:
+    """
+    Drop papers whose PDF content duplicates an earlier entry.
+
+    Zotero libraries often attach the same file to two entries (preprint and
+    published version); keying on the content hash means each unique PDF is
+    analyzed and pushed to Notion once. Reuses the review-cache hash.
+    """
+    seen: Dict[str, PaperPair] = {}
+    unique = []
+    for paper in papers:
+        key = _pdf_content_key(paper.pdf_path)
+        first = seen.get(key)
+        if first is None:
+            seen[key] = paper
+            unique.append(paper)
+        else:
+            logger.warning(
+                "Skipping %s: same PDF content as %s",
+                paper.metadata.bib_key,
+                first.metadata.bib_key,
+            )
+    return unique
+
+
+def process_single_paper(
+    paper: PaperPair, config: ConfigModel, dry_run: bool = False
+) -> bool:
     """
     Process a single paper through the full pipeline.
 
@@ -34,11 +116,12 @@ def process_single_paper(paper: PaperPair, config: ConfigModel) -> bool:
     1. Analyze PDF with Gemini
     2. Convert review to Notion blocks
     3. Build Notion properties from metadata
-    4. Create Notion page
+    4. Create Notion page (skipped when dry_run is set)
 
     Args:
         paper: PaperPair object containing metadata and PDF path
         config: Configuration object with API keys and database ID
+        dry_run: If True, run analysis and conversion but skip Notion I/O
 
     Returns:
         True if processing succeeded, False otherwise
@@ -47,21 +130,36 @@ def process_single_paper(paper: PaperPair, config: ConfigModel) -> bool:
     logger.info(f"Processing paper: {bib_key}")
 
     try:
-        # Step 1: Analyze PDF with Gemini
-        logger.debug(f"Analyzing PDF: {paper.pdf_path}")
-        review_json = analyze_paper(paper.pdf_path, config.gemini_api_key)
-        logger.debug(f"Received review data with {len(review_json)} fields")
-
-        # Step 2: Convert review to Notion blocks
+        # Step 1: Analyze PDF with Gemini (skipped on a review-cache hit,
+        # which is typically 80-95% of this pipeline's wall time)
+        t0 = time.perf_counter()
+        cache_key = _pdf_content_key(paper.pdf_path)
+        review_json = _load_cached_review(cache_key)
+        if review_json is not None:
+            logger.info(f"Using cached review for {bib_key}")
+        else:
+            logger.debug(f"Analyzing PDF: {paper.pdf_path}")
+            review_json = analyze_paper(paper.pdf_path, config.gemini_api_key)
+            logger.debug(f"Received review data with {len(review_json)} fields")
+            _store_cached_review(cache_key, review_json)
+        logger.info("%s: gemini=%.2fs", bib_key, time.perf_counter() - t0)
+
+        # Steps 2+3: Convert review to Notion blocks and build properties
+        t0 = time.perf_counter()
         logger.debug("Converting review to Notion blocks")
         blocks = transform_to_notion_blocks(review_json)
         logger.debug(f"Created {len(blocks)} Notion blocks")
 
-        # Step 3: Build Notion properties from metadata
         logger.debug("Building Notion properties")
         properties = build_notion_properties(paper.metadata)
+        logger.info("%s: convert=%.2fs", bib_key, time.perf_counter() - t0)
+
+        if dry_run:
+            logger.info(f"Dry run: skipping Notion page creation for {bib_key}")
+            return True
 
         # Step 4: Create Notion page
+        t0 = time.perf_counter()
         logger.debug("Creating Notion page")
         page_id = create_paper_page(
             config.notion_token,
@@ -69,6 +167,7 @@ def process_single_paper(paper: PaperPair, config: ConfigModel) -> bool:
             properties,
             blocks,
         )
+        logger.info("%s: notion=%.2fs", bib_key, time.perf_counter() - t0)
         logger.info(f"Successfully created Notion page: {page_id}")
 
         return True
@@ -94,6 +193,56 @@ def process_single_paper(paper: PaperPair, config: ConfigModel) -> bool:
         return False
 
 
+async def _process_papers(
+    papers: list,
+    config: ConfigModel,
+    concurrency: int,
+    progress,
+    task_id,
+    dry_run: bool = False,
+) -> tuple:
+    """
+    Process papers concurrently, updating the progress tracker as they finish.
+
+    Each paper's pipeline is independent and network-latency-bound, so they
+    run via asyncio.to_thread under a semaphore; wall time drops from the sum
+    of per-paper latencies toward the longest batch.
+
+    Args:
+        papers: List of PaperPair objects to process
+        config: Configuration object with API keys and database ID
+        concurrency: Maximum number of papers processed at once
+        progress: Rich Progress instance
+        task_id: Progress task to advance per completed paper
+        dry_run: Passed through to process_single_paper
+
+    Returns:
+        Tuple of (success_count, failure_count)
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _run(paper: PaperPair) -> tuple:
+        async with sem:
+            return paper, await asyncio.to_thread(
+                process_single_paper, paper, config, dry_run
+            )
+
+    success_count = 0
+    failure_count = 0
+
+    for completed in asyncio.as_completed([_run(paper) for paper in papers]):
+        paper, succeeded = await completed
+        bib_key = paper.metadata.bib_key
+        if succeeded:
+            success_count += 1
+            progress.console.print(f"[bold green]✔[/bold green] Completed: {bib_key}")
+        else:
+            failure_count += 1
+        progress.update(task_id, advance=1)
+
+    return success_count, failure_count
+
+
 def main(directory: Optional[Union[Path, str]] = None) -> int:
     """
     Main CLI entry point for paper reviewer.
@@ -111,6 +260,7 @@ def main(directory: Optional[Union[Path, str]] = None) -> int:
     try:
         # Parse command-line arguments if directory not provided
         zotero_bib_path = None
+        dry_run = False
         if directory is None:
             parser = argparse.ArgumentParser(
                 description="Automatically review research papers and sync to Notion"
@@ -127,9 +277,15 @@ def main(directory: Optional[Union[Path, str]] = None) -> int:
                 dest="zotero_bib",
                 help="Path to Zotero-exported BibTeX file (alternative to directory scanning)",
             )
+            parser.add_argument(
+                "--dry-run",
+                action="store_true",
+                help="Analyze papers but skip Notion page creation (useful for profiling)",
+            )
             args = parser.parse_args()
             directory = args.directory
             zotero_bib_path = args.zotero_bib
+            dry_run = args.dry_run
 
         # Load configuration
         try:
@@ -165,6 +321,18 @@ def main(directory: Optional[Union[Path, str]] = None) -> int:
                 display_error(f"Failed to parse Zotero BibTeX file: {str(e)}")
                 logger.error(f"Failed to parse Zotero BibTeX file: {str(e)}", exc_info=True)
                 return 1
+
+            # Drop entries whose attached PDF is missing up front, so the
+            # concurrency slots aren't wasted on papers that would fail at
+            # upload time anyway
+            valid, invalid = [], []
+            for paper in papers:
+                (valid if paper.pdf_path.exists() else invalid).append(paper)
+            if invalid:
+                missing = ", ".join(p.metadata.bib_key for p in invalid)
+                display_error(f"Skipping {len(invalid)} entries with missing PDFs: {missing}")
+                logger.warning("Skipping %d entries with missing PDFs: %s", len(invalid), missing)
+            papers = valid
         else:
             # Existing directory scanning workflow (unchanged)
             # Convert to Path object
@@ -201,13 +369,15 @@ def main(directory: Optional[Union[Path, str]] = None) -> int:
             logger.info("No papers found in directory")
             return 0
 
+        # Drop exact-duplicate PDFs so each file is processed once
+        papers = _dedup_papers(papers)
+
         # Display papers table
         logger.info(f"Found {len(papers)} paper(s) to process")
         display_papers_table(papers)
 
-        # Process papers with progress tracking
-        success_count = 0
-        failure_count = 0
+        # Process papers concurrently with progress tracking
+        concurrency = int(os.getenv("PAPER_CONCURRENCY", "4"))
 
         with create_progress_tracker(len(papers)) as progress:
             task_id = progress.add_task(
@@ -215,29 +385,17 @@ def main(directory: Optional[Union[Path, str]] = None) -> int:
                 total=len(papers),
             )
 
-            for paper in papers:
-                bib_key = paper.metadata.bib_key
-                progress.update(
-                    task_id,
-                    description=f"[cyan]Processing {bib_key}...",
-                )
-
-                # Process paper
-                if process_single_paper(paper, config):
-                    success_count += 1
-                    progress.console.print(f"[bold green]✔[/bold green] Completed: {bib_key}")
-                else:
-                    failure_count += 1
-
-                # Advance progress
-                progress.update(task_id, advance=1)
-
-        # Display summary
+            success_count, failure_count = asyncio.run(
+                _process_papers(papers, config, concurrency, progress, task_id, dry_run)
+            )
+
+        # Display summary in one render pass
         logger.info(f"Processing complete: {success_count} succeeded, {failure_count} failed")
-        if success_count > 0:
-            display_success(f"Successfully processed {success_count} paper(s)")
-        if failure_count > 0:
-            display_error(f"Failed to process {failure_count} paper(s)")
+        with batch_output():
+            if success_count > 0:
+                display_success(f"Successfully processed {success_count} paper(s)")
+            if failure_count > 0:
+                display_error(f"Failed to process {failure_count} paper(s)")
 
         # Return appropriate exit code
         return 0 if failure_count == 0 else 1
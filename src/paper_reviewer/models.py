@@ -1,9 +1,18 @@
 """Core data models for paper reviewer CLI."""
 
+import os
+import re
+import stat
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+
+# Author separator in BibTeX: " and " (case-insensitive), compiled once
+_AUTHOR_AND_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+# Notion database IDs are 32 hex chars once dashes are stripped
+_HEX32_RE = re.compile(r"^[0-9a-fA-F]{32}$")
 
 
 class BibTeXEntry(BaseModel):
@@ -24,9 +33,19 @@ class BibTeXEntry(BaseModel):
         description="Publication year",
     )
     bib_key: str = Field(..., alias="ID", description="BibTeX entry ID/key")
-    url: Optional[HttpUrl] = Field(None, description="Paper URL")
+    url: Optional[str] = Field(None, description="Paper URL")
     doi: Optional[str] = Field(None, description="Digital Object Identifier")
 
+    @field_validator("url", mode="before")
+    @classmethod
+    def check_url_scheme(cls, v):
+        """Cheap scheme check instead of full HttpUrl parsing (hot per-entry path)."""
+        if v is None:
+            return v
+        if isinstance(v, str) and v.startswith(("http://", "https://")):
+            return v
+        raise ValueError(f"URL must start with http:// or https://: {v}")
+
     @field_validator("authors", mode="before")
     @classmethod
     def parse_authors(cls, v):
@@ -40,16 +59,9 @@ class BibTeXEntry(BaseModel):
             # Split by " and " first (case-insensitive), preserving structure
             # Handle "Doe, John and Smith, Jane" -> ["Doe, John", "Smith, Jane"]
             # Handle "Doe, John, Smith, Jane" -> ["Doe", "John", "Smith", "Jane"]
-            parts = []
-            # Use regex-like splitting but simpler: split by " and " first
-            if " and " in v.lower():
-                # Split by " and " (case-insensitive)
-                import re
-                parts = [p.strip() for p in re.split(r'\s+and\s+', v, flags=re.IGNORECASE)]
-            else:
-                # No "and", just split by comma
-                parts = [v]
-            
+            # Single precompiled split; without a separator it just yields [v]
+            parts = _AUTHOR_AND_RE.split(v)
+
             authors = []
             for part in parts:
                 part = part.strip()
@@ -87,10 +99,17 @@ class PaperPair(BaseModel):
     @field_validator("pdf_path")
     @classmethod
     def validate_pdf_exists(cls, v: Path) -> Path:
-        """Validate that PDF file exists."""
-        if not v.exists():
+        """
+        Validate that PDF file exists and is a regular file.
+
+        Scanners that have already stat-ed the path skip this by building
+        pairs with model_construct; one os.stat answers both checks here.
+        """
+        try:
+            st = os.stat(v)
+        except OSError:
             raise ValueError(f"PDF file does not exist: {v}")
-        if not v.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {v}")
         return v
 
@@ -139,14 +158,11 @@ class Config(BaseModel):
         """Basic validation for Notion database ID format."""
         # Remove dashes if present (Notion IDs can be with or without dashes)
         clean_id = v.replace("-", "")
-        if len(clean_id) != 32:
+        # One precompiled match covers both length and hex-ness, without
+        # building a 128-bit int just to throw it away
+        if not _HEX32_RE.match(clean_id):
             raise ValueError(
                 f"Invalid Notion database ID format: {v}. "
                 "Expected 32-character hex string (with or without dashes)."
             )
-        # Check if it's valid hex
-        try:
-            int(clean_id, 16)
-        except ValueError:
-            raise ValueError(f"Invalid Notion database ID format: {v}. Must be hexadecimal.")
         return v
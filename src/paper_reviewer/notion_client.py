@@ -1,10 +1,42 @@
 """Notion API client for creating paper pages."""
 
+import functools
 from typing import Dict, List
 
+import httpx
 from notion_client import APIResponseError, Client
 
 from .errors import NotionAPIError
+from .retry import retry_transient
+
+# Notion API limit on children blocks per request
+_MAX_BLOCKS_PER_REQUEST = 100
+
+# Constant error message hoisted out of the raise site
+_ERR_NO_PAGE_ID = "Page created but no ID returned in response"
+
+# HTTP/2 multiplexes the page-create and block-append calls over one
+# connection, but httpx only supports it when the h2 extra is installed
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(token: str) -> Client:
+    """Return a shared Client for this token, reusing its keep-alive pool."""
+    http_client = httpx.Client(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        timeout=httpx.Timeout(60.0),
+    )
+    # retry_transient already handles rate limits and transient 5xx with
+    # Retry-After support; disable the SDK's own retry loop so backoff
+    # delays don't stack multiplicatively
+    return Client(auth=token, client=http_client, retry=False)
 
 
 def create_paper_page(
@@ -31,14 +63,18 @@ def create_paper_page(
         >>> # page_id = create_paper_page(token, db_id, props, blocks)
     """
     try:
-        # Initialize Notion client
-        client = Client(auth=token)
+        # Reuse one client per token so every page creation shares the same
+        # connection pool instead of paying a fresh TLS handshake
+        client = _get_client(token)
 
-        # Create page with blocks
+        # Create page with blocks; retries happen per API call inside, so
+        # a transient failure mid-append never re-creates the page
         page_id = create_page_with_blocks(client, db_id, properties, blocks)
 
         return page_id
 
+    except NotionAPIError:
+        raise
     except APIResponseError as e:
         # APIResponseError has code and message attributes
         error_msg = getattr(e, "message", str(e))
@@ -52,6 +88,36 @@ def create_paper_page(
         ) from e
 
 
+@retry_transient
+def _create_page(client: Client, db_id: str, properties: Dict, children: List[Dict]) -> Dict:
+    """Create the page itself, retrying this call alone on transient errors."""
+    try:
+        return client.pages.create(
+            parent={"database_id": db_id},
+            properties=properties,
+            children=children,
+        )
+    except APIResponseError as e:
+        error_msg = getattr(e, "message", str(e))
+        error_code = getattr(e, "code", "unknown")
+        raise NotionAPIError(
+            f"Notion API error creating page ({error_code}): {error_msg}", file_path=None
+        ) from e
+
+
+@retry_transient
+def _append_children(client: Client, page_id: str, children: List[Dict]) -> None:
+    """Append one block batch, retrying this call alone on transient errors."""
+    try:
+        client.blocks.children.append(block_id=page_id, children=children)
+    except APIResponseError as e:
+        error_msg = getattr(e, "message", str(e))
+        error_code = getattr(e, "code", "unknown")
+        raise NotionAPIError(
+            f"Notion API error appending blocks ({error_code}): {error_msg}", file_path=None
+        ) from e
+
+
 def create_page_with_blocks(
     client: Client, db_id: str, properties: Dict, blocks: List[Dict]
 ) -> str:
@@ -71,29 +137,27 @@ def create_page_with_blocks(
         NotionAPIError: If page creation fails
     """
     try:
-        # Create page with properties and blocks
-        response = client.pages.create(
-            parent={"database_id": db_id},
-            properties=properties,
-            children=blocks,
-        )
+        # Notion caps children at 100 blocks per request, so create the page
+        # with the first chunk and batch-append the rest. Each API call
+        # carries its own retry: once the page exists, a transient failure
+        # on an append retries just that batch instead of re-running the
+        # whole sequence and duplicating the page.
+        head, tail = blocks[:_MAX_BLOCKS_PER_REQUEST], blocks[_MAX_BLOCKS_PER_REQUEST:]
+
+        response = _create_page(client, db_id, properties, head)
 
         # Extract page ID from response
         page_id = response.get("id")
         if not page_id:
-            raise NotionAPIError(
-                "Page created but no ID returned in response", file_path=None
+            raise NotionAPIError(_ERR_NO_PAGE_ID, file_path=None)
+
+        for start in range(0, len(tail), _MAX_BLOCKS_PER_REQUEST):
+            _append_children(
+                client, page_id, tail[start : start + _MAX_BLOCKS_PER_REQUEST]
             )
 
         return page_id
 
-    except APIResponseError as e:
-        # APIResponseError has code and message attributes
-        error_msg = getattr(e, "message", str(e))
-        error_code = getattr(e, "code", "unknown")
-        raise NotionAPIError(
-            f"Notion API error creating page ({error_code}): {error_msg}", file_path=None
-        ) from e
     except Exception as e:
         if isinstance(e, NotionAPIError):
             raise
@@ -1,10 +1,25 @@
 """Notion block converter module for transforming Gemini review JSON to Notion blocks."""
 
+import re
+import textwrap
 from typing import Dict, List
 
+# Markdown-style bullet marker at the start of a line
+_BULLET_RE = re.compile(r"^[-*]\s+")
+
 # Maximum characters per rich_text element in Notion API
 NOTION_RICH_TEXT_LIMIT = 2000
 
+# Section order and headings, fixed per review format
+_SECTION_ORDER = (
+    ("summary", "Overview"),
+    ("novelty", "1. Novelty & Impact"),
+    ("methodology", "2. Methodology"),
+    ("validation", "3. Validation"),
+    ("discussion", "4. Discussion"),
+    ("next_steps", "5. Next Steps"),
+)
+
 
 def transform_to_notion_blocks(review_json: Dict[str, str]) -> List[Dict]:
     """
@@ -23,25 +38,23 @@ def transform_to_notion_blocks(review_json: Dict[str, str]) -> List[Dict]:
         >>> len(blocks) > 0
         True
     """
-    blocks = []
+    # Fail fast on accidental string input (e.g. an unparsed response.text)
+    # rather than iterating characters downstream
+    if not isinstance(review_json, dict):
+        raise TypeError(
+            f"review_json must be a dict, got {type(review_json).__name__}"
+        )
 
-    # Mapping from JSON keys to Notion headings
-    mapping = {
-        "summary": "Overview",
-        "novelty": "1. Novelty & Impact",
-        "methodology": "2. Methodology",
-        "validation": "3. Validation",
-        "discussion": "4. Discussion",
-        "next_steps": "5. Next Steps",
-    }
+    blocks = []
 
-    for key, heading in mapping.items():
+    for key, heading in _SECTION_ORDER:
         content = review_json.get(key, "")
         if not content or not content.strip():
             continue
 
-        # Add heading block
-        blocks.append(create_heading_block(heading))
+        # Add heading block (prebuilt once per section; these dicts are
+        # static and only ever serialized, never mutated)
+        blocks.append(_HEADING_BLOCKS[key])
 
         # Add content blocks (smart splitting)
         content_blocks = _create_content_blocks(content)
@@ -73,6 +86,15 @@ def create_heading_block(text: str) -> Dict:
     }
 
 
+# Heading blocks are identical for every paper, so build them once
+_HEADING_BLOCKS = {key: create_heading_block(heading) for key, heading in _SECTION_ORDER}
+
+# Outer block shells are constant; builders copy these two-key templates and
+# fill in the rich_text payload, skipping one dict literal per block
+_PARAGRAPH_TEMPLATE = {"type": "paragraph", "paragraph": None}
+_BULLET_TEMPLATE = {"type": "bulleted_list_item", "bulleted_list_item": None}
+
+
 def create_paragraph_block(text: str) -> Dict:
     """
     Create a Notion paragraph block.
@@ -88,14 +110,12 @@ def create_paragraph_block(text: str) -> Dict:
         >>> block["type"] == "paragraph"
         True
     """
-    # Truncate to Notion's limit
-    truncated_text = text[:NOTION_RICH_TEXT_LIMIT]
-    return {
-        "type": "paragraph",
-        "paragraph": {
-            "rich_text": [{"type": "text", "text": {"content": truncated_text}}]
-        },
-    }
+    # Truncate to Notion's limit; skip the copy when the text already fits
+    if len(text) > NOTION_RICH_TEXT_LIMIT:
+        text = text[:NOTION_RICH_TEXT_LIMIT]
+    block = _PARAGRAPH_TEMPLATE.copy()
+    block["paragraph"] = {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    return block
 
 
 def create_bullet_block(text: str) -> Dict:
@@ -113,14 +133,14 @@ def create_bullet_block(text: str) -> Dict:
         >>> block["type"] == "bulleted_list_item"
         True
     """
-    # Truncate to Notion's limit
-    truncated_text = text[:NOTION_RICH_TEXT_LIMIT]
-    return {
-        "type": "bulleted_list_item",
-        "bulleted_list_item": {
-            "rich_text": [{"type": "text", "text": {"content": truncated_text}}]
-        },
+    # Truncate to Notion's limit; skip the copy when the text already fits
+    if len(text) > NOTION_RICH_TEXT_LIMIT:
+        text = text[:NOTION_RICH_TEXT_LIMIT]
+    block = _BULLET_TEMPLATE.copy()
+    block["bulleted_list_item"] = {
+        "rich_text": [{"type": "text", "text": {"content": text}}]
     }
+    return block
 
 
 def split_content_smartly(content: str) -> List[str]:
@@ -145,28 +165,24 @@ def split_content_smartly(content: str) -> List[str]:
     if not content:
         return []
 
-    # Split by newlines
-    lines = content.split("\n")
+    # splitlines() is a single C-level pass and, unlike split("\n"), does
+    # not produce a trailing empty element for newline-terminated content
+    lines = content.splitlines()
 
     # Strip and filter empty lines
-    cleaned_lines = [line.strip() for line in lines if line.strip()]
+    cleaned_lines = [stripped for line in lines if (stripped := line.strip())]
 
     if not cleaned_lines:
         return []
 
     # Check if content looks like a list (starts with - or *)
-    is_list = any(
-        line.startswith("- ") or line.startswith("* ") for line in cleaned_lines
-    )
+    is_list = any(_BULLET_RE.match(line) for line in cleaned_lines)
 
     if is_list:
-        # Extract list items by removing bullet markers
-        items = []
-        for line in cleaned_lines:
-            # Remove bullet markers
-            item = line.lstrip("- ").lstrip("* ").strip()
-            if item:
-                items.append(item)
+        # Strip bullet markers in one C-level regex pass per line; unlike the
+        # old lstrip("- ") chain this only removes an actual leading marker
+        items = [_BULLET_RE.sub("", line).strip() for line in cleaned_lines]
+        items = [item for item in items if item]
         return items if items else cleaned_lines
 
     # Check if multiple lines exist (treat as list even without bullets)
@@ -196,7 +212,25 @@ def _create_content_blocks(content: str) -> List[Dict]:
 
     # If multiple items, use bullet blocks
     if len(items) > 1:
-        return [create_bullet_block(item) for item in items]
+        blocks = []
+        for item in items:
+            for chunk in _wrap_to_limit(item):
+                blocks.append(create_bullet_block(chunk))
+        return blocks
 
     # Single item - use paragraph block
-    return [create_paragraph_block(items[0])]
+    return [create_paragraph_block(chunk) for chunk in _wrap_to_limit(items[0])]
+
+
+def _wrap_to_limit(text: str) -> List[str]:
+    """
+    Split text into chunks within Notion's rich_text limit.
+
+    Most items fit in one chunk and are returned as-is; overflowing text is
+    wrapped at word boundaries instead of being silently truncated.
+    """
+    if len(text) <= NOTION_RICH_TEXT_LIMIT:
+        return [text]
+    return textwrap.wrap(
+        text, NOTION_RICH_TEXT_LIMIT, break_long_words=False, break_on_hyphens=False
+    )
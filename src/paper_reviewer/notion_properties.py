@@ -4,6 +4,8 @@ from typing import Dict, List, Optional
 
 from .models import BibTeXEntry
 
+_DOI_PREFIX = "https://doi.org/"
+
 
 def build_notion_properties(metadata: BibTeXEntry) -> Dict:
     """
@@ -34,34 +36,24 @@ def build_notion_properties(metadata: BibTeXEntry) -> Dict:
         >>> "Name" in props
         True
     """
-    properties = {}
-
-    # Title property (required)
-    properties["Name"] = {
-        "title": [{"type": "text", "text": {"content": metadata.title}}]
-    }
-
-    # Authors property (multi_select)
-    if metadata.authors:
-        properties["Authors"] = {
-            "multi_select": format_authors(metadata.authors)
-        }
-
-    # Year property (number)
-    if metadata.year is not None:
-        properties["Year"] = {"number": metadata.year}
-
-    # BibTeX Key property (rich_text)
-    properties["BibTeX Key"] = {
-        "rich_text": [{"type": "text", "text": {"content": metadata.bib_key}}]
-    }
-
-    # URL/DOI property (url)
     url_or_doi = extract_url_or_doi(metadata)
-    if url_or_doi:
-        properties["URL/DOI"] = {"url": url_or_doi}
 
-    return properties
+    # One dict literal pre-sizes the hash table (BUILD_MAP) instead of
+    # growing it with stepwise assignment; optional fields merge in via
+    # conditional unpacking
+    return {
+        "Name": {"title": [{"type": "text", "text": {"content": metadata.title}}]},
+        **(
+            {"Authors": {"multi_select": format_authors(metadata.authors)}}
+            if metadata.authors
+            else {}
+        ),
+        **({"Year": {"number": metadata.year}} if metadata.year is not None else {}),
+        "BibTeX Key": {
+            "rich_text": [{"type": "text", "text": {"content": metadata.bib_key}}]
+        },
+        **({"URL/DOI": {"url": url_or_doi}} if url_or_doi else {}),
+    }
 
 
 def format_authors(authors: List[str]) -> List[Dict]:
@@ -102,15 +94,14 @@ def extract_url_or_doi(metadata: BibTeXEntry) -> Optional[str]:
     """
     # Prefer URL over DOI
     if metadata.url:
-        # HttpUrl is a Pydantic type that can be converted to string
-        return str(metadata.url)
+        return metadata.url
 
     if metadata.doi:
         # DOI might need to be formatted as URL
         # If it's already a URL, return as-is, otherwise prepend https://doi.org/
-        doi_str = str(metadata.doi)
+        doi_str = metadata.doi
         if doi_str.startswith(("http://", "https://")):
             return doi_str
-        return f"https://doi.org/{doi_str}"
+        return _DOI_PREFIX + doi_str
 
     return None
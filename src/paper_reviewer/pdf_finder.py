@@ -1,11 +1,22 @@
 """PDF file finder module."""
 
 import logging
+import os
+import stat
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Realistic case variants (same set the original glob patterns covered);
+# endswith on a tuple avoids a lowercased copy of every filename
+_PDF_SUFFIXES = (".pdf", ".PDF", ".Pdf")
+
+# Tooling directories that never hold paper PDFs; descending into them
+# (node_modules especially) can dwarf the useful part of the walk
+_SKIP_DIRS = frozenset({"__MACOSX", "node_modules", ".venv", "__pycache__"})
+
 
 def find_pdf_in_directory(directory: Path) -> Optional[Path]:
     """
@@ -23,21 +34,46 @@ def find_pdf_in_directory(directory: Path) -> Optional[Path]:
     Raises:
         PDFNotFoundError: If multiple PDFs found and strict mode is enabled
     """
-    if not directory.exists():
+    # One os.stat answers both "exists" and "is a directory"; the old
+    # exists() + is_dir() pair stat-ed the same path twice before the walk
+    try:
+        st = os.stat(directory)
+    except OSError:
         logger.warning(f"Directory does not exist: {directory}")
         return None
 
-    if not directory.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         logger.warning(f"Path is not a directory: {directory}")
         return None
 
-    # Find all PDF files recursively (case-insensitive)
+    # Walk once with os.scandir: DirEntry.is_file() reuses the dirent type
+    # from the directory read, so the whole search avoids per-file stat calls
+    # and the old triple rglob pass (*.pdf/*.PDF/*.Pdf). Breadth-first order
+    # (deque) reaches a shallow PDF before exploring deep subtrees, and only
+    # the single vs multiple distinction matters, so the walk stops as soon
+    # as a second PDF shows up.
     pdf_files = []
-    for pattern in ["*.pdf", "*.PDF", "*.Pdf"]:
-        pdf_files.extend(directory.rglob(pattern))
-
-    # Filter to only actual files (not directories)
-    pdf_files = [f for f in pdf_files if f.is_file()]
+    queue = deque([directory])
+    while queue and len(pdf_files) < 2:
+        current = queue.popleft()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune hidden and tooling directories instead of
+                        # walking them
+                        name = entry.name
+                        if not name.startswith(".") and name not in _SKIP_DIRS:
+                            queue.append(entry.path)
+                    elif (
+                        entry.name.endswith(_PDF_SUFFIXES)
+                        and entry.is_file(follow_symlinks=False)
+                    ):
+                        pdf_files.append(Path(entry.path))
+                        if len(pdf_files) > 1:
+                            break
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {current}: {e}")
 
     if not pdf_files:
         logger.debug(f"No PDF files found in directory: {directory}")
@@ -45,7 +81,7 @@ def find_pdf_in_directory(directory: Path) -> Optional[Path]:
 
     if len(pdf_files) > 1:
         logger.warning(
-            f"Multiple PDF files found in directory {directory}: {len(pdf_files)} files. "
+            f"Multiple PDF files found in directory {directory}. "
             f"Using first one: {pdf_files[0]}"
         )
 
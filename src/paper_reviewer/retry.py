@@ -0,0 +1,86 @@
+"""Retry helpers for transient Gemini and Notion API failures."""
+
+import logging
+from typing import Optional
+
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+from .errors import GeminiAPIError, NotionAPIError
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_TRANSIENT_HTTP_STATUSES = {429, 500, 502, 503, 504}
+
+# notion-client surfaces error codes as strings rather than HTTP statuses
+_TRANSIENT_NOTION_CODES = {
+    "rate_limited",
+    "internal_server_error",
+    "service_unavailable",
+    "gateway_timeout",
+}
+
+
+def _transient_status(exc: BaseException) -> bool:
+    """Check whether the wrapped cause carries a retryable status or code."""
+    cause = exc.__cause__
+    if cause is None:
+        return False
+
+    for attr in ("status", "status_code", "code"):
+        value = getattr(cause, attr, None)
+        if value is None:
+            continue
+        if isinstance(value, str):
+            if value in _TRANSIENT_NOTION_CODES:
+                return True
+            continue
+        try:
+            if int(value) in _TRANSIENT_HTTP_STATUSES:
+                return True
+        except (TypeError, ValueError):
+            continue
+
+    return False
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Retry predicate: our API errors wrapping a transient HTTP failure."""
+    return isinstance(exc, (GeminiAPIError, NotionAPIError)) and _transient_status(exc)
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Extract a Retry-After delay from the wrapped cause, if the API sent one."""
+    headers = getattr(exc.__cause__, "headers", None)
+    if headers is None or not hasattr(headers, "get"):
+        return None
+    retry_after = headers.get("Retry-After") or headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+
+_base_wait = wait_exponential_jitter(initial=1, max=30)
+
+
+def _wait_transient(retry_state) -> float:
+    """Honor the API's Retry-After header when present, else back off with jitter."""
+    exc = retry_state.outcome.exception()
+    if exc is not None:
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return retry_after
+    return _base_wait(retry_state)
+
+
+# Decorator for API entry points: up to 5 attempts on transient failures,
+# with exponential backoff + jitter (or the server-provided Retry-After)
+retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=_wait_transient,
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
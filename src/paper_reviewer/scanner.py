@@ -1,18 +1,25 @@
 """Directory scanner module for finding and pairing BibTeX and PDF files."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Tuple
 
 from .bibtex_parser import parse_bibtex_file
 from .errors import BibTeXParseError
 from .models import BibTeXEntry, PaperPair
-from .pdf_finder import find_pdf_in_directory
+from .pdf_finder import _SKIP_DIRS
 
 logger = logging.getLogger(__name__)
 
+# Realistic case variants (the same set the original glob patterns covered);
+# endswith on a tuple is allocation-free, unlike name.lower() per entry
+_BIB_SUFFIXES = (".bib", ".BIB", ".Bib")
+_PDF_SUFFIXES = (".pdf", ".PDF", ".Pdf")
 
-def scan_directory(directory: Path) -> List[PaperPair]:
+
+def scan_directory(directory: Path) -> Tuple[PaperPair, ...]:
     """
     Scan a directory for BibTeX and PDF files, pairing them together.
 
@@ -25,7 +32,30 @@ def scan_directory(directory: Path) -> List[PaperPair]:
         directory: Root directory to scan
 
     Returns:
-        List of PaperPair objects, one for each BibTeX entry paired with its PDF
+        Tuple of PaperPair objects, one for each BibTeX entry paired with its
+        PDF; a tuple because callers treat the result as read-only
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    paper_pairs = tuple(iter_scan_directory(directory))
+    logger.info(f"Found {len(paper_pairs)} paper pairs in {directory}")
+    return paper_pairs
+
+
+def iter_scan_directory(directory: Path) -> Iterator[PaperPair]:
+    """
+    Stream PaperPair objects as each (sub)directory finishes scanning.
+
+    Generator form of scan_directory: callers that process papers one at a
+    time can start on the first pair while the remaining subdirectories are
+    still being scanned, overlapping filesystem I/O with downstream work.
+
+    Args:
+        directory: Root directory to scan
+
+    Yields:
+        PaperPair objects in sorted-subdirectory order
 
     Raises:
         FileNotFoundError: If the directory does not exist
@@ -36,36 +66,61 @@ def scan_directory(directory: Path) -> List[PaperPair]:
     if not directory.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
 
-    paper_pairs = []
-
     # Check if the root directory itself DIRECTLY contains a .bib and .pdf
-    # (not in subdirectories) to decide between single directory mode and recursive mode
-    bib_files_direct = list(directory.glob("*.bib")) + list(directory.glob("*.BIB")) + list(directory.glob("*.Bib"))
-    bib_files_direct = [f for f in bib_files_direct if f.is_file()]
-    pdf_files_direct = list(directory.glob("*.pdf")) + list(directory.glob("*.PDF")) + list(directory.glob("*.Pdf"))
-    pdf_files_direct = [f for f in pdf_files_direct if f.is_file()]
+    # (not in subdirectories) to decide between single directory mode and
+    # recursive mode. One shallow scandir pass replaces six glob calls.
+    has_bib, has_pdf = _has_bib_and_pdf_shallow(directory)
 
-    if bib_files_direct and pdf_files_direct:
+    if has_bib and has_pdf:
         # Single directory mode: process the root directory
         logger.info(f"Processing directory: {directory}")
-        pairs = scan_single_directory(directory)
-        paper_pairs.extend(pairs)
+        yield from scan_single_directory(directory)
     else:
-        # Recursive mode: process subdirectories
+        # Recursive mode: process subdirectories in parallel. The per-paper
+        # work is stat/readdir syscalls that release the GIL, so threads
+        # overlap directory latency; map() keeps results in sorted order.
         logger.info(f"Scanning subdirectories in: {directory}")
-        for subdir in sorted(directory.iterdir()):
-            if not subdir.is_dir():
-                continue
-
-            try:
-                pairs = scan_single_directory(subdir)
-                paper_pairs.extend(pairs)
-            except Exception as e:
-                logger.warning(f"Skipping directory {subdir} due to error: {e}")
-                continue
-
-    logger.info(f"Found {len(paper_pairs)} paper pairs in {directory}")
-    return paper_pairs
+        subdirs = sorted(
+            d
+            for d in directory.iterdir()
+            if d.is_dir() and not d.name.startswith(".") and d.name not in _SKIP_DIRS
+        )
+        if len(subdirs) < 4:
+            # Not enough parallelism to amortize pool startup; stay serial
+            for subdir in subdirs:
+                yield from _scan_subdir_quietly(subdir)
+        else:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for pairs in executor.map(_scan_subdir_quietly, subdirs):
+                    yield from pairs
+
+
+def _has_bib_and_pdf_shallow(directory: Path) -> tuple:
+    """Check for a .bib and a .pdf directly in a directory (no recursion)."""
+    has_bib = has_pdf = False
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(_BIB_SUFFIXES):
+                    has_bib = has_bib or entry.is_file(follow_symlinks=False)
+                elif name.endswith(_PDF_SUFFIXES):
+                    has_pdf = has_pdf or entry.is_file(follow_symlinks=False)
+                if has_bib and has_pdf:
+                    break
+    except OSError as e:
+        logger.debug(f"Could not scan directory {directory}: {e}")
+    return has_bib, has_pdf
+
+
+def _scan_subdir_quietly(subdir: Path) -> List[PaperPair]:
+    """Scan one subdirectory, downgrading errors to a warning (worker-safe)."""
+    try:
+        return scan_single_directory(subdir)
+    except Exception as e:
+        logger.warning(f"Skipping directory {subdir} due to error: {e}")
+        return []
 
 
 def scan_single_directory(directory: Path) -> List[PaperPair]:
@@ -81,14 +136,12 @@ def scan_single_directory(directory: Path) -> List[PaperPair]:
     Raises:
         BibTeXParseError: If BibTeX file cannot be parsed
     """
-    # Find the BibTeX file
-    bib_file = _find_bibtex_file(directory)
+    # Find the BibTeX and PDF files in one recursive pass
+    bib_file, pdf_file = _find_bib_and_pdf(directory)
     if not bib_file:
         logger.debug(f"No BibTeX file found in directory: {directory}")
         return []
 
-    # Find the PDF file
-    pdf_file = find_pdf_in_directory(directory)
     if not pdf_file:
         logger.warning(f"No PDF file found in directory: {directory}")
         return []
@@ -126,40 +179,58 @@ def scan_single_directory(directory: Path) -> List[PaperPair]:
     return paper_pairs
 
 
-def _find_bibtex_file(directory: Path) -> Optional[Path]:
+def _find_bib_and_pdf(directory: Path) -> tuple:
     """
-    Find the single BibTeX file in a directory.
+    Find the first BibTeX and first PDF file in one recursive walk.
 
-    Searches recursively in the directory and subdirectories.
-    Returns the first `.bib` file found, or None if none exists.
+    One traversal finds both files, so large directories are enumerated
+    once, and it stops as soon as both are found. Warns when a duplicate
+    of either kind shows up before the walk ends.
 
     Args:
-        directory: Directory path to search for BibTeX files
+        directory: Directory path to search
 
     Returns:
-        Path to the first BibTeX file found, or None if no BibTeX file found
+        Tuple of (bib_path or None, pdf_path or None)
     """
-    if not directory.exists() or not directory.is_dir():
-        return None
-
-    # Find all BibTeX files recursively (case-insensitive)
-    bib_files = []
-    for pattern in ["*.bib", "*.BIB", "*.Bib"]:
-        bib_files.extend(directory.rglob(pattern))
-
-    # Filter to only actual files (not directories)
-    bib_files = [f for f in bib_files if f.is_file()]
-
-    if not bib_files:
-        return None
-
-    if len(bib_files) > 1:
-        logger.warning(
-            f"Multiple BibTeX files found in directory {directory}: {len(bib_files)} files. "
-            f"Using first one: {bib_files[0]}"
-        )
-
-    return bib_files[0]
+    bib_file = pdf_file = None
+    bib_warned = pdf_warned = False
+    stack = [directory]
+    while stack and not (bib_file and pdf_file):
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune hidden and tooling directories (same set the
+                        # PDF finder skips) instead of walking them
+                        name = entry.name
+                        if not name.startswith(".") and name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    if name.endswith(_BIB_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                        if bib_file is None:
+                            bib_file = Path(entry.path)
+                        elif not bib_warned:
+                            bib_warned = True
+                            logger.warning(
+                                f"Multiple BibTeX files found in directory {directory}. "
+                                f"Using first one: {bib_file}"
+                            )
+                    elif name.endswith(_PDF_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                        if pdf_file is None:
+                            pdf_file = Path(entry.path)
+                        elif not pdf_warned:
+                            pdf_warned = True
+                            logger.warning(
+                                f"Multiple PDF files found in directory {directory}. "
+                                f"Using first one: {pdf_file}"
+                            )
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {current}: {e}")
+
+    return bib_file, pdf_file
 
 
 def _create_paper_pair(entry: BibTeXEntry, pdf_path: Path) -> PaperPair:
@@ -172,8 +243,7 @@ def _create_paper_pair(entry: BibTeXEntry, pdf_path: Path) -> PaperPair:
 
     Returns:
         PaperPair object
-
-    Raises:
-        ValueError: If PDF file does not exist (handled by PaperPair model)
     """
-    return PaperPair(metadata=entry, pdf_path=pdf_path)
+    # The walk that found pdf_path already confirmed it is a regular file,
+    # so skip the model's re-validation (and its stat) via model_construct
+    return PaperPair.model_construct(metadata=entry, pdf_path=pdf_path)
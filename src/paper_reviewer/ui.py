@@ -1,22 +1,58 @@
 """Rich UI components for paper reviewer CLI."""
 
-from typing import List
-
-from rich.console import Console
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-    TimeRemainingColumn,
-)
-from rich.table import Table
+import functools
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, List, Optional
 
 from .models import PaperPair
 
-# Singleton console instance for consistent output
-_console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
+# rich (and the pygments it drags in) is imported lazily inside each
+# function so `--help`-style invocations don't pay its import cost
+
+
+# When set, display_* helpers append markup lines here instead of printing;
+# batch_output() flushes them in one Console.print call
+_batch_buffer: Optional[List[str]] = None
+
+
+@contextmanager
+def batch_output():
+    """
+    Buffer display_success/error/info output and flush it in one print.
+
+    Console.print parses markup and computes ANSI codes per call; when a
+    caller emits one line per paper this batches the whole run into a single
+    render pass.
+    """
+    global _batch_buffer
+    previous = _batch_buffer
+    _batch_buffer = []
+    try:
+        yield
+    finally:
+        lines, _batch_buffer = _batch_buffer, previous
+        if lines:
+            _emit("\n".join(lines))
+
+
+def _emit(markup: str) -> None:
+    """Print a markup line, or buffer it inside a batch_output() block."""
+    if _batch_buffer is not None:
+        _batch_buffer.append(markup)
+    else:
+        _get_console().print(markup)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Singleton console instance for consistent output (created on first use)."""
+    from rich.console import Console
+
+    return Console()
 
 
 def display_papers_table(papers: List[PaperPair]) -> None:
@@ -26,11 +62,20 @@ def display_papers_table(papers: List[PaperPair]) -> None:
     Args:
         papers: List of PaperPair objects to display
     """
+    from rich.table import Table
+
     if not papers:
-        _console.print("[yellow]No papers found to display.[/yellow]")
+        _get_console().print("[yellow]No papers found to display.[/yellow]")
         return
 
-    table = Table(title="Papers to Process", show_header=True, header_style="bold magenta")
+    # pad_edge/show_lines off to minimize rich's per-row layout work
+    table = Table(
+        title="Papers to Process",
+        show_header=True,
+        header_style="bold magenta",
+        pad_edge=False,
+        show_lines=False,
+    )
     table.add_column("BibTeX Key", style="cyan", no_wrap=True)
     table.add_column("Title", style="white", max_width=50)
     table.add_column("PDF Path", style="green", max_width=40)
@@ -47,10 +92,11 @@ def display_papers_table(papers: List[PaperPair]) -> None:
         if len(pdf_path) > 40:
             pdf_path = "..." + pdf_path[-37:]
 
-        # Format authors (show first 2, then "...")
+        # Format authors (show first 2, then "..."); the f-string avoids
+        # allocating a slice plus join for the common long-author-list case
         authors = paper.metadata.authors
         if len(authors) > 2:
-            authors_str = ", ".join(authors[:2]) + f", ... ({len(authors) - 2} more)"
+            authors_str = f"{authors[0]}, {authors[1]}, ... ({len(authors) - 2} more)"
         elif authors:
             authors_str = ", ".join(authors)
         else:
@@ -63,10 +109,10 @@ def display_papers_table(papers: List[PaperPair]) -> None:
             authors_str,
         )
 
-    _console.print(table)
+    _get_console().print(table)
 
 
-def create_progress_tracker(total: int) -> Progress:
+def create_progress_tracker(total: int) -> "Progress":
     """
     Create a Rich Progress instance for tracking paper processing.
 
@@ -76,13 +122,28 @@ def create_progress_tracker(total: int) -> Progress:
     Returns:
         Progress instance configured with appropriate columns
     """
-    return Progress(
+    from rich.progress import Progress
+
+    return Progress(*_get_progress_columns(), console=_get_console())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_progress_columns() -> tuple:
+    """Column objects shared across Progress instances (stateless between runs)."""
+    from rich.progress import (
+        BarColumn,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
+    return (
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
         TimeRemainingColumn(),
-        console=_console,
     )
 
 
@@ -93,7 +154,7 @@ def display_success(message: str) -> None:
     Args:
         message: Success message to display
     """
-    _console.print(f"[bold green]✔[/bold green] {message}")
+    _emit(f"[bold green]✔[/bold green] {message}")
 
 
 def display_error(message: str) -> None:
@@ -103,7 +164,7 @@ def display_error(message: str) -> None:
     Args:
         message: Error message to display
     """
-    _console.print(f"[bold red]✘[/bold red] {message}")
+    _emit(f"[bold red]✘[/bold red] {message}")
 
 
 def display_info(message: str) -> None:
@@ -113,4 +174,4 @@ def display_info(message: str) -> None:
     Args:
         message: Info message to display
     """
-    _console.print(f"[bold blue]ℹ[/bold blue] {message}")
+    _emit(f"[bold blue]ℹ[/bold blue] {message}")
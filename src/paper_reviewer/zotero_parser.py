@@ -1,22 +1,63 @@
 """Zotero BibTeX file parser module for extracting PDF paths from file fields."""
 
+import errno
 import logging
+import os
 import re
+import stat
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import bibtexparser
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
 
-from .bibtex_parser import extract_metadata
+from .bibtex_parser import (
+    _cache_path_for,
+    _decode_bib_bytes,
+    _dedup_entries,
+    _load_cached_entries,
+    _store_cached_entries,
+    extract_metadata,
+)
 from .errors import BibTeXParseError, PDFNotFoundError
 from .models import BibTeXEntry, PaperPair
 
 logger = logging.getLogger(__name__)
 
+# Zotero file field: PDF:<escaped_path>:application/pdf (compiled once; the
+# extraction runs per entry, so pattern lookup cost adds up on big libraries)
+_ZOTERO_PDF_RE = re.compile(r"^PDF:(.+?):application/pdf$")
+# Path normalization in one pass: an escaped drive-letter colon sequence
+# loses its leading backslash, any other backslash run collapses to one
+_NORMALIZE_PATH_RE = re.compile(r"\\([A-Za-z]:)|(\\+)")
 
-def extract_pdf_path_from_file_field(file_field: str) -> Optional[Path]:
+
+def _normalize_path_match(m: "re.Match") -> str:
+    return m.group(1) if m.group(1) else "\\"
+
+
+class _StatCache:
+    """Per-parse memo of path validation results.
+
+    Zotero libraries keep every attachment under the same storage root and
+    often repeat file fields across entries, so within one parse call the
+    same path - or a path under the same missing directory - should never
+    be stat-ed twice.
+    """
+
+    __slots__ = ("paths", "missing_dirs")
+
+    def __init__(self) -> None:
+        self.paths: Dict[str, Optional[Path]] = {}
+        self.missing_dirs: set = set()
+
+
+def extract_pdf_path_from_file_field(
+    file_field: str, stat_cache: Optional[_StatCache] = None
+) -> Optional[Path]:
     """
     Extract PDF path from Zotero file field format.
 
@@ -25,6 +66,8 @@ def extract_pdf_path_from_file_field(file_field: str) -> Optional[Path]:
 
     Args:
         file_field: The file field value from BibTeX entry
+        stat_cache: Optional per-parse memo of validation results; repeated
+            paths and paths under known-missing directories skip the syscall
 
     Returns:
         Path object if successfully extracted and file exists, None otherwise
@@ -37,10 +80,15 @@ def extract_pdf_path_from_file_field(file_field: str) -> Optional[Path]:
     if file_field.startswith("{") and file_field.endswith("}"):
         file_field = file_field[1:-1]
 
+    # Cheapest test first: a C-level substring check rejects obvious
+    # non-PDF fields without starting the regex engine
+    if "application/pdf" not in file_field:
+        logger.debug(f"File field does not match Zotero PDF format: {file_field[:50]}...")
+        return None
+
     # Match pattern: PDF:<path>:application/pdf
     # Handle both Windows (C\:\\...) and Unix (/home/...) paths
-    pattern = r"^PDF:(.+?):application/pdf$"
-    match = re.match(pattern, file_field)
+    match = _ZOTERO_PDF_RE.match(file_field)
 
     if not match:
         logger.debug(f"File field does not match Zotero PDF format: {file_field[:50]}...")
@@ -55,42 +103,68 @@ def extract_pdf_path_from_file_field(file_field: str) -> Optional[Path]:
     
     # Normalize Windows paths
     # Handle escaped colon: C\: -> C: (for patterns like C\:Users)
-    path_str = re.sub(r"\\([A-Za-z]):", r"\1:", path_str)
-    
     # Normalize multiple consecutive backslashes to single backslash
     # This handles cases like C:\\Users (double backslash) or C\:\\Users (escaped)
-    # Replace any sequence of backslashes with a single backslash
-    path_str = re.sub(r"\\+", r"\\", path_str)
+    # One fused pass walks the string once instead of two sub() calls
+    path_str = _NORMALIZE_PATH_RE.sub(_normalize_path_match, path_str)
     
-    # Path() will handle further normalization and works with both / and \ on Windows
+    # Memoized rejections first: a repeated path returns its previous
+    # verdict (already logged once), and a path under a directory known to
+    # be missing fails without a syscall
+    if stat_cache is not None:
+        if path_str in stat_cache.paths:
+            return stat_cache.paths[path_str]
+        if os.path.dirname(path_str) in stat_cache.missing_dirs:
+            logger.warning(f"PDF path from file field does not exist: {path_str}")
+            stat_cache.paths[path_str] = None
+            return None
 
+    # Validate on the raw string: one os.stat answers both existence and
+    # regular-file checks, and stale entries (the common rejection case on
+    # old libraries) never pay for PurePath flavour parsing. Path() is
+    # built only for survivors and handles / vs \ normalization itself.
     try:
-        pdf_path = Path(path_str)
-        
-        # Validate path exists
-        if not pdf_path.exists():
-            logger.warning(f"PDF path from file field does not exist: {pdf_path}")
+        try:
+            st = os.stat(path_str)
+        except OSError as e:
+            logger.warning(f"PDF path from file field does not exist: {path_str}")
+            if stat_cache is not None:
+                stat_cache.paths[path_str] = None
+                if e.errno == errno.ENOENT:
+                    # One extra stat learns whether the whole directory is
+                    # gone, so siblings in the same dead dir cost nothing
+                    parent = os.path.dirname(path_str)
+                    if parent and not os.path.isdir(parent):
+                        stat_cache.missing_dirs.add(parent)
             return None
-        
-        if not pdf_path.is_file():
-            logger.warning(f"PDF path from file field is not a file: {pdf_path}")
+
+        if not stat.S_ISREG(st.st_mode):
+            logger.warning(f"PDF path from file field is not a file: {path_str}")
+            if stat_cache is not None:
+                stat_cache.paths[path_str] = None
             return None
-        
+
+        pdf_path = Path(path_str)
+        if stat_cache is not None:
+            stat_cache.paths[path_str] = pdf_path
         return pdf_path
     except Exception as e:
         logger.debug(f"Error converting file field to Path: {e}")
         return None
 
 
-def parse_zotero_bib_file(bib_path: Path) -> List[PaperPair]:
+def parse_zotero_bib_file(bib_path: Path, use_cache: bool = True) -> List[PaperPair]:
     """
     Parse a Zotero-exported BibTeX file and extract PDF paths from file fields.
 
     This function reads a BibTeX file, extracts metadata using the existing parser,
-    and pairs each entry with its PDF path from the 'file' field.
+    and pairs each entry with its PDF path from the 'file' field. Results are
+    cached on disk keyed by path, mtime and size (same scheme as
+    parse_bibtex_file), so unchanged exports skip parsing on later runs.
 
     Args:
         bib_path: Path to the Zotero-exported `.bib` file
+        use_cache: Whether to read/write the on-disk parse cache
 
     Returns:
         List of PaperPair objects, one for each BibTeX entry with a valid PDF path
@@ -105,6 +179,14 @@ def parse_zotero_bib_file(bib_path: Path) -> List[PaperPair]:
     if not bib_path.is_file():
         raise BibTeXParseError(f"Path is not a file: {bib_path}", str(bib_path))
 
+    cache_path = None
+    if use_cache:
+        cache_path = _cache_path_for(bib_path, namespace="zotero")
+        cached = _load_cached_entries(cache_path)
+        if cached is not None:
+            logger.debug("Using cached parse for %s", bib_path)
+            return cached
+
     try:
         # Configure parser to handle unicode and preserve all fields
         parser = BibTexParser()
@@ -113,78 +195,63 @@ def parse_zotero_bib_file(bib_path: Path) -> List[PaperPair]:
         parser.homogenise_fields = True
         parser.expect_multiple_parse = False
 
-        # Try different encodings
-        encodings = ["utf-8", "latin-1", "cp1252"]
-        entries = None
-        last_error = None
-
-        for encoding in encodings:
-            try:
-                with open(bib_path, "r", encoding=encoding) as f:
-                    file_content = f.read()
-
-                bib_database = bibtexparser.loads(file_content, parser=parser)
-                entries = bib_database.entries
-
-                # Deduplicate entries by ID
-                seen_ids = set()
-                unique_entries = []
-                for entry in entries:
-                    entry_id = entry.get("id") or entry.get("ID") or entry.get("key")
-                    if entry_id and entry_id not in seen_ids:
-                        seen_ids.add(entry_id)
-                        unique_entries.append(entry)
-                    elif not entry_id:
-                        unique_entries.append(entry)
-
-                entries = unique_entries
-                break
-            except UnicodeDecodeError as e:
-                last_error = e
-                continue
-            except Exception as e:
-                last_error = e
-                continue
+        # Read the bytes once and decode with the shared single-pass helper
+        # (utf-8 with latin-1 fallback); the old loop re-read and re-parsed
+        # the whole file per candidate encoding, and retried the expensive
+        # bibtexparser pass even when the failure wasn't encoding-related
+        file_content = _decode_bib_bytes(bib_path.read_bytes())
 
-        if entries is None:
+        try:
+            bib_database = bibtexparser.loads(file_content, parser=parser)
+        except Exception as e:
             raise BibTeXParseError(
-                f"Failed to parse BibTeX file with any encoding: {bib_path}. "
-                f"Last error: {last_error}",
+                f"Failed to parse BibTeX file: {bib_path}. Error: {e}",
                 str(bib_path),
-            ) from last_error
+            ) from e
+
+        # Deduplicate entries by ID (shared streaming helper)
+        entries = list(_dedup_entries(bib_database.entries))
 
         # Process entries and create PaperPair objects
         paper_pairs = []
         skipped_count = 0
 
+        # Cheap rejections first: resolve the file field before
+        # extract_metadata, so entries without a usable PDF never pay for
+        # author parsing and model construction (_dedup_entries already
+        # normalized the 'id' field)
+        candidates = []
         for entry in entries:
+            file_field = entry.get("file") or entry.get("File") or entry.get("FILE")
+            if not file_field:
+                bib_key = entry.get("id", "unknown")
+                logger.warning(
+                    f"Entry '{bib_key}' does not have a 'file' field. Skipping."
+                )
+                skipped_count += 1
+                continue
+            candidates.append((entry, file_field))
+
+        # Path resolution is one stat() syscall per entry, which releases
+        # the GIL; on large libraries running them in a thread pool overlaps
+        # the disk latency. map() preserves entry order. Small inputs stay
+        # serial so pool startup isn't the dominant cost (same threshold
+        # pattern as the scanner).
+        # One stat cache per parse call: duplicate file fields and entries
+        # under a missing storage directory resolve from memory
+        stat_cache = _StatCache()
+        resolve = partial(extract_pdf_path_from_file_field, stat_cache=stat_cache)
+        if len(candidates) < 4:
+            pdf_paths = [resolve(f) for _, f in candidates]
+        else:
+            workers = min(32, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pdf_paths = list(executor.map(resolve, (f for _, f in candidates)))
+
+        for (entry, file_field), pdf_path in zip(candidates, pdf_paths):
             try:
-                # Ensure entry has ID field
-                if "id" not in entry:
-                    if "ID" in entry:
-                        entry["id"] = entry["ID"]
-                    elif hasattr(entry, "key"):
-                        entry["id"] = entry.key
-
-                # Extract metadata using existing function
-                bibtex_entry = extract_metadata(entry)
-
-                # Extract file field (check both lowercase and title case)
-                file_field = entry.get("file") or entry.get("File") or entry.get("FILE")
-
-                if not file_field:
-                    bib_key = bibtex_entry.bib_key
-                    logger.warning(
-                        f"Entry '{bib_key}' does not have a 'file' field. Skipping."
-                    )
-                    skipped_count += 1
-                    continue
-
-                # Extract PDF path from file field
-                pdf_path = extract_pdf_path_from_file_field(file_field)
-
                 if pdf_path is None:
-                    bib_key = bibtex_entry.bib_key
+                    bib_key = entry.get("id", "unknown")
                     logger.warning(
                         f"Could not extract valid PDF path from file field for entry '{bib_key}'. "
                         f"File field: {file_field[:100]}..."
@@ -192,8 +259,12 @@ def parse_zotero_bib_file(bib_path: Path) -> List[PaperPair]:
                     skipped_count += 1
                     continue
 
-                # Create PaperPair
-                paper_pair = PaperPair(metadata=bibtex_entry, pdf_path=pdf_path)
+                # Only survivors pay the metadata-extraction cost
+                bibtex_entry = extract_metadata(entry)
+
+                # Create PaperPair; extract_pdf_path_from_file_field just
+                # stat-ed the path, so skip the model's re-validation
+                paper_pair = PaperPair.model_construct(metadata=bibtex_entry, pdf_path=pdf_path)
                 paper_pairs.append(paper_pair)
                 logger.debug(
                     f"Created PaperPair for '{bibtex_entry.bib_key}' with PDF: {pdf_path}"
@@ -202,11 +273,15 @@ def parse_zotero_bib_file(bib_path: Path) -> List[PaperPair]:
             except BibTeXParseError:
                 # Re-raise BibTeX parsing errors
                 raise
-            except Exception as e:
-                entry_id = entry.get("ID") or entry.get("id") or entry.get("key", "unknown")
-                logger.warning(
-                    f"Skipping entry '{entry_id}' due to error: {e}", exc_info=True
-                )
+            except (KeyError, AttributeError, TypeError, ValueError) as e:
+                # Expected malformed-entry failures (including pydantic
+                # validation); skip without formatting a full traceback,
+                # which is O(stack depth) per entry and adds up on messy
+                # libraries. Unexpected exceptions propagate to the outer
+                # handler, which still logs with exc_info.
+                # _dedup_entries already normalized 'id', so one lookup does
+                entry_id = entry.get("id", "unknown")
+                logger.warning(f"Skipping entry '{entry_id}' due to error: {e!r}")
                 skipped_count += 1
                 continue
 
@@ -227,6 +302,9 @@ def parse_zotero_bib_file(bib_path: Path) -> List[PaperPair]:
             f"Skipped {skipped_count} entry/entries."
         )
 
+        if cache_path is not None:
+            _store_cached_entries(cache_path, paper_pairs)
+
         return paper_pairs
 
     except BibTeXParseError:
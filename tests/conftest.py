@@ -1,19 +1,145 @@
 """Shared pytest fixtures for paper-reviewer-cli tests."""
 
-import tempfile
 from pathlib import Path
-from typing import Generator
+
+import logging
 
 import pytest
 
 from paper_reviewer.models import BibTeXEntry, Config, PaperPair
 
 
+@pytest.fixture(scope="session")
+def _session_bibcache(tmp_path_factory) -> Path:
+    """One bib parse cache for the whole run, so each fixture .bib parses once."""
+    return tmp_path_factory.mktemp("bibcache")
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch, _session_bibcache):
+    """Point on-disk caches at test tmp dirs so runs don't pollute ~/.cache.
+
+    The bib parse cache is shared across the session (keyed on path, mtime
+    and size, so tests writing distinct files can't collide); the review
+    cache stays per-test because several tests assert cache-miss behavior.
+    """
+    from paper_reviewer import bibtex_parser, main
+
+    monkeypatch.setattr(bibtex_parser, "_CACHE_DIR", _session_bibcache)
+    monkeypatch.setattr(main, "_REVIEW_CACHE_DIR", tmp_path / "reviews")
+
+
+@pytest.fixture
+def warning_records():
+    """Collect WARNING records from the package logger into a plain list.
+
+    Lighter than caplog for tests that only grep one message: the handler
+    is a bare list.append, with no record formatting or capture plumbing.
+    """
+    records = []
+    handler = logging.Handler(level=logging.WARNING)
+    handler.emit = records.append
+    pkg_logger = logging.getLogger("paper_reviewer")
+    old_level = pkg_logger.level
+    pkg_logger.addHandler(handler)
+    pkg_logger.setLevel(logging.WARNING)
+    try:
+        yield records
+    finally:
+        pkg_logger.removeHandler(handler)
+        pkg_logger.setLevel(old_level)
+
+
+@pytest.fixture(scope="session")
+def write_zotero_bib():
+    """Return a helper that writes a Zotero-style .bib file.
+
+    Entries are (key, title, file_spec) tuples; file_spec may be a Path
+    (backslash-escaped once, as Zotero exports do), a raw string used
+    verbatim, or None to omit the file field. Centralizes the template so
+    tests don't rebuild it with repeated f-string/replace passes.
+    """
+
+    def _write(path: Path, entries) -> Path:
+        parts = []
+        for key, title, file_spec in entries:
+            parts.append(f"@article{{{key},\n  title={{{title}}}")
+            if file_spec is not None:
+                if isinstance(file_spec, Path):
+                    file_spec = str(file_spec).replace("\\", "\\\\")
+                parts.append(f",\n  file={{PDF:{file_spec}:application/pdf}}")
+            parts.append("\n}\n")
+        path.write_text("".join(parts))
+        return path
+
+    return _write
+
+
+@pytest.fixture(scope="session")
+def pdf_tree_single(tmp_path_factory) -> Path:
+    """Read-only tree with one lowercase PDF, built once per session."""
+    d = tmp_path_factory.mktemp("pdf_single")
+    (d / "test.pdf").touch()
+    return d
+
+
+@pytest.fixture(scope="session")
+def pdf_tree_upper(tmp_path_factory) -> Path:
+    """Read-only tree with one uppercase-extension PDF."""
+    d = tmp_path_factory.mktemp("pdf_upper")
+    (d / "test.PDF").touch()
+    return d
+
+
+@pytest.fixture(scope="session")
+def pdf_tree_mixed(tmp_path_factory) -> Path:
+    """Read-only tree with one mixed-case-extension PDF."""
+    d = tmp_path_factory.mktemp("pdf_mixed")
+    (d / "test.Pdf").touch()
+    return d
+
+
+@pytest.fixture(scope="session")
+def pdf_tree_nested(tmp_path_factory) -> Path:
+    """Read-only tree with the PDF two levels down."""
+    d = tmp_path_factory.mktemp("pdf_nested")
+    level2 = d / "level1" / "level2"
+    level2.mkdir(parents=True)
+    (level2 / "test.pdf").touch()
+    return d
+
+
+@pytest.fixture(scope="session")
+def pdf_tree_multi(tmp_path_factory) -> Path:
+    """Read-only tree with two PDFs side by side."""
+    d = tmp_path_factory.mktemp("pdf_multi")
+    (d / "first.pdf").touch()
+    (d / "second.pdf").touch()
+    return d
+
+
+@pytest.fixture(scope="session")
+def pdf_tree_empty(tmp_path_factory) -> Path:
+    """Read-only empty directory."""
+    return tmp_path_factory.mktemp("pdf_empty")
+
+
+@pytest.fixture(scope="session")
+def sample_papers_dir() -> Path:
+    """Base path of the sample_papers fixtures, computed once per session."""
+    return Path(__file__).parent / "fixtures" / "sample_papers"
+
+
+@pytest.fixture(scope="session")
+def fixture_pdf_cache() -> dict:
+    """Memoized find_pdf_in_directory results so fixture trees walk once."""
+    return {}
+
+
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path: Path) -> Path:
+    """Per-test directory backed by pytest's session-scoped tmp factory."""
+    return tmp_path
 
 
 @pytest.fixture
@@ -52,5 +178,5 @@ def sample_config() -> Config:
 def sample_paper_pair(sample_bibtex_entry, temp_dir) -> PaperPair:
     """Create a sample PaperPair for testing."""
     pdf_path = temp_dir / "test.pdf"
-    pdf_path.write_bytes(b"%PDF-1.4\n")  # Minimal valid PDF header
+    pdf_path.touch()  # Minimal valid PDF header
     return PaperPair(metadata=sample_bibtex_entry, pdf_path=pdf_path)
@@ -1,6 +1,7 @@
 """Mock utilities for testing API integrations."""
 
 import json
+from types import SimpleNamespace
 from typing import Dict
 from unittest.mock import MagicMock
 
@@ -22,6 +23,23 @@ def create_mock_gemini_response() -> Dict[str, str]:
     }
 
 
+def create_mock_file_handle(name: str = "files/test", state: str = "ACTIVE"):
+    """
+    Create a lightweight mock Gemini file handle.
+
+    A SimpleNamespace is enough for handles that are only read via attribute
+    access, and is far cheaper than a MagicMock per test.
+
+    Args:
+        name: File resource name
+        state: Processing state string
+
+    Returns:
+        SimpleNamespace with name and state attributes
+    """
+    return SimpleNamespace(name=name, state=state)
+
+
 def create_mock_gemini_client(mocker, response_data: Dict[str, str] = None):
     """
     Create a mocked Gemini client.
@@ -36,14 +54,9 @@ def create_mock_gemini_client(mocker, response_data: Dict[str, str] = None):
     if response_data is None:
         response_data = create_mock_gemini_response()
 
-    # Create mock file handle
-    mock_file_handle = MagicMock()
-    mock_file_handle.name = "files/test_file_123"
-    mock_file_handle.state = "ACTIVE"
-
-    # Create mock response
-    mock_response = MagicMock()
-    mock_response.text = json.dumps(response_data)  # Proper JSON string
+    # Create mock file handle and response (attribute-only, so namespaces)
+    mock_file_handle = create_mock_file_handle(name="files/test_file_123")
+    mock_response = SimpleNamespace(text=json.dumps(response_data))
 
     # Create mock client
     mock_client = MagicMock()
@@ -3,7 +3,11 @@
 import pytest
 from pathlib import Path
 
-from paper_reviewer.bibtex_parser import extract_metadata, parse_bibtex_file
+from paper_reviewer.bibtex_parser import (
+    extract_metadata,
+    parse_bibtex_file,
+    parse_bibtex_files,
+)
 from paper_reviewer.errors import BibTeXParseError
 from paper_reviewer.models import BibTeXEntry
 
@@ -128,6 +132,53 @@ class TestParseBibtexFile:
             pass
 
 
+class TestParseBibtexFiles:
+    """Test parse_bibtex_files batch function."""
+
+    @staticmethod
+    def _write_bib(path: Path, key: str, title: str) -> Path:
+        path.write_text(
+            f"""@article{{{key},
+  title={{{title}}},
+  author={{Doe, John}},
+  year={{2024}}
+}}"""
+        )
+        return path
+
+    def test_empty_list(self):
+        """An empty batch returns an empty dict without spawning a pool."""
+        assert parse_bibtex_files([]) == {}
+
+    def test_single_file(self, temp_dir):
+        """A single file is parsed sequentially and keyed by its path."""
+        bib_file = self._write_bib(temp_dir / "one.bib", "one2024", "Only Paper")
+
+        results = parse_bibtex_files([bib_file])
+
+        assert list(results) == [bib_file]
+        assert results[bib_file][0].bib_key == "one2024"
+
+    def test_multiple_files_round_trip(self, temp_dir):
+        """Each path maps to the entries parsed from that file."""
+        first = self._write_bib(temp_dir / "first.bib", "first2024", "First Paper")
+        second = self._write_bib(temp_dir / "second.bib", "second2023", "Second Paper")
+
+        results = parse_bibtex_files([first, second])
+
+        assert set(results) == {first, second}
+        assert results[first][0].title == "First Paper"
+        assert results[second][0].title == "Second Paper"
+
+    def test_error_propagates(self, temp_dir):
+        """A failing file surfaces its exception from the pool."""
+        good = self._write_bib(temp_dir / "good.bib", "good2024", "Good Paper")
+        missing = temp_dir / "missing.bib"
+
+        with pytest.raises(FileNotFoundError):
+            parse_bibtex_files([good, missing])
+
+
 class TestExtractMetadata:
     """Test extract_metadata function."""
 
@@ -2,13 +2,19 @@
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from paper_reviewer.errors import GeminiAPIError, NotionAPIError
 from paper_reviewer.gemini_client import analyze_paper, parse_gemini_response, upload_pdf, wait_for_file_processing
-from paper_reviewer.main import main, process_single_paper
+from paper_reviewer.main import (
+    _load_cached_review,
+    _store_cached_review,
+    main,
+    process_single_paper,
+)
 from paper_reviewer.notion_client import create_paper_page, create_page_with_blocks
 from paper_reviewer.notion_converter import (
     create_bullet_block,
@@ -20,6 +26,7 @@ from paper_reviewer.notion_converter import (
 from paper_reviewer.notion_properties import build_notion_properties, extract_url_or_doi, format_authors
 from paper_reviewer.scanner import scan_directory, scan_single_directory
 from tests.mocks import (
+    create_mock_file_handle,
     create_mock_gemini_client,
     create_mock_gemini_response,
     create_mock_notion_api_error,
@@ -234,9 +241,8 @@ class TestGeminiAPIMocking:
 
     def test_parse_gemini_response_valid(self):
         """Test parsing valid Gemini response."""
-        mock_response = MagicMock()
         response_data = create_mock_gemini_response()
-        mock_response.text = json.dumps(response_data)
+        mock_response = SimpleNamespace(text=json.dumps(response_data))
 
         result = parse_gemini_response(mock_response)
 
@@ -246,8 +252,7 @@ class TestGeminiAPIMocking:
 
     def test_parse_gemini_response_missing_fields(self):
         """Test parsing response with missing fields."""
-        mock_response = MagicMock()
-        mock_response.text = json.dumps({"summary": "Test"})
+        mock_response = SimpleNamespace(text=json.dumps({"summary": "Test"}))
 
         result = parse_gemini_response(mock_response)
 
@@ -257,16 +262,14 @@ class TestGeminiAPIMocking:
 
     def test_parse_gemini_response_invalid_json(self):
         """Test parsing invalid JSON response."""
-        mock_response = MagicMock()
-        mock_response.text = "Not valid JSON"
+        mock_response = SimpleNamespace(text="Not valid JSON")
 
         with pytest.raises(GeminiAPIError):
             parse_gemini_response(mock_response)
 
     def test_parse_gemini_response_missing_text(self):
         """Test parsing response without text attribute."""
-        mock_response = MagicMock()
-        del mock_response.text
+        mock_response = SimpleNamespace()
 
         with pytest.raises(GeminiAPIError):
             parse_gemini_response(mock_response)
@@ -275,9 +278,7 @@ class TestGeminiAPIMocking:
     def test_upload_pdf_success(self, mock_client_class, sample_paper_pair):
         """Test successful PDF upload."""
         mock_client = MagicMock()
-        mock_file_handle = MagicMock()
-        mock_file_handle.name = "files/test"
-        mock_file_handle.state = "ACTIVE"
+        mock_file_handle = create_mock_file_handle()
         mock_client.files.upload.return_value = mock_file_handle
         mock_client_class.return_value = mock_client
 
@@ -298,9 +299,7 @@ class TestGeminiAPIMocking:
     def test_wait_for_file_processing_active(self, mock_client_class):
         """Test waiting for file processing when already active."""
         mock_client = MagicMock()
-        mock_file_handle = MagicMock()
-        mock_file_handle.name = "files/test"
-        mock_file_handle.state = "ACTIVE"
+        mock_file_handle = create_mock_file_handle()
         mock_client.files.get.return_value = mock_file_handle
         mock_client_class.return_value = mock_client
 
@@ -312,9 +311,7 @@ class TestGeminiAPIMocking:
     def test_wait_for_file_processing_failed(self, mock_client_class):
         """Test waiting for file processing when it fails."""
         mock_client = MagicMock()
-        mock_file_handle = MagicMock()
-        mock_file_handle.name = "files/test"
-        mock_file_handle.state = "FAILED"
+        mock_file_handle = create_mock_file_handle(state="FAILED")
         mock_client.files.get.return_value = mock_file_handle
         mock_client_class.return_value = mock_client
 
@@ -328,16 +325,13 @@ class TestGeminiAPIMocking:
         """Test successful paper analysis."""
         # Setup mocks
         mock_client = MagicMock()
-        mock_file_handle = MagicMock()
-        mock_file_handle.name = "files/test"
-        mock_file_handle.state = "ACTIVE"
+        mock_file_handle = create_mock_file_handle()
         mock_client_class.return_value = mock_client
         mock_upload.return_value = mock_file_handle
         mock_wait.return_value = True
 
         response_data = create_mock_gemini_response()
-        mock_response = MagicMock()
-        mock_response.text = json.dumps(response_data)
+        mock_response = SimpleNamespace(text=json.dumps(response_data))
         mock_client.files.get.return_value = mock_file_handle
         mock_client.models.generate_content.return_value = mock_response
 
@@ -372,6 +366,75 @@ class TestNotionAPIMocking:
         with pytest.raises(NotionAPIError):
             create_page_with_blocks(mock_client, sample_config.notion_database_id, properties, blocks)
 
+    @pytest.mark.parametrize(
+        "total,append_batches",
+        [(0, []), (100, []), (250, [100, 50])],
+        ids=["empty", "exactly_one_chunk", "two_append_batches"],
+    )
+    def test_create_page_with_blocks_chunking(self, sample_config, total, append_batches):
+        """Blocks beyond the 100-block limit are appended in order, none lost."""
+        mock_client = create_mock_notion_client(None, "test-page-123")
+        blocks = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": str(i)}}]}}
+            for i in range(total)
+        ]
+        properties = {"Name": {"title": [{"type": "text", "text": {"content": "Test"}}]}}
+
+        page_id = create_page_with_blocks(
+            mock_client, sample_config.notion_database_id, properties, blocks
+        )
+
+        assert page_id == "test-page-123"
+        create_children = mock_client.pages.create.call_args.kwargs["children"]
+        assert len(create_children) == min(total, 100)
+
+        append_calls = mock_client.blocks.children.append.call_args_list
+        assert [len(c.kwargs["children"]) for c in append_calls] == append_batches
+        for call in append_calls:
+            assert call.kwargs["block_id"] == "test-page-123"
+
+        # Concatenating the create payload and the append batches must
+        # reproduce the original block list exactly
+        sent = list(create_children)
+        for call in append_calls:
+            sent.extend(call.kwargs["children"])
+        assert sent == blocks
+
+    def test_transient_append_failure_does_not_recreate_page(self, sample_config, monkeypatch):
+        """A rate-limited append retries that batch only; the page is created once."""
+        import httpx
+        from notion_client import APIResponseError
+
+        from paper_reviewer import notion_client as notion_client_module
+
+        monkeypatch.setattr(
+            notion_client_module._append_children.retry, "sleep", lambda _: None
+        )
+        mock_client = create_mock_notion_client(None, "test-page-123")
+        rate_limited = APIResponseError(
+            code="rate_limited",
+            status=429,
+            message="rate limited",
+            headers=httpx.Headers({}),
+            raw_body_text="",
+        )
+        mock_client.blocks.children.append.side_effect = [rate_limited, {"results": []}]
+
+        properties = {"Name": {"title": [{"type": "text", "text": {"content": "Test"}}]}}
+        blocks = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": str(i)}}]}}
+            for i in range(150)
+        ]
+
+        page_id = create_page_with_blocks(
+            mock_client, sample_config.notion_database_id, properties, blocks
+        )
+
+        assert page_id == "test-page-123"
+        # The page is never re-created; only the failed append is retried
+        assert mock_client.pages.create.call_count == 1
+        assert mock_client.blocks.children.append.call_count == 2
+
     def test_create_paper_page_success(self, sample_config):
         """Test successful paper page creation."""
         mock_client = create_mock_notion_client(None, "test-page-123")
@@ -385,6 +448,63 @@ class TestNotionAPIMocking:
             assert page_id == "test-page-123"
 
 
+class TestReviewCache:
+    """Test the on-disk review cache used by process_single_paper."""
+
+    def test_store_load_round_trip(self):
+        review = {"summary": "s", "novelty": "n"}
+
+        _store_cached_review("roundtrip-key", review)
+
+        assert _load_cached_review("roundtrip-key") == review
+
+    def test_load_miss_returns_none(self):
+        assert _load_cached_review("never-stored") is None
+
+    @patch("paper_reviewer.main.create_paper_page")
+    @patch("paper_reviewer.main.analyze_paper")
+    def test_second_run_skips_analysis(
+        self, mock_analyze, mock_create_page, sample_paper_pair, sample_config
+    ):
+        """A re-run of the same PDF serves the review from cache."""
+        mock_analyze.return_value = create_mock_gemini_response()
+        mock_create_page.return_value = "test-page-123"
+
+        assert process_single_paper(sample_paper_pair, sample_config) is True
+        assert process_single_paper(sample_paper_pair, sample_config) is True
+
+        mock_analyze.assert_called_once()
+        assert mock_create_page.call_count == 2
+
+    @pytest.mark.parametrize(
+        "attr,stale_value",
+        [("_MODEL_NAME", "some-older-model"), ("_PROMPT_HASH", "0000000000000000")],
+        ids=["model_changed", "prompt_changed"],
+    )
+    @patch("paper_reviewer.main.create_paper_page")
+    @patch("paper_reviewer.main.analyze_paper")
+    def test_stale_entry_busts_cache(
+        self,
+        mock_analyze,
+        mock_create_page,
+        attr,
+        stale_value,
+        sample_paper_pair,
+        sample_config,
+        monkeypatch,
+    ):
+        """Changing the model or prompt hash invalidates cached reviews."""
+        mock_analyze.return_value = create_mock_gemini_response()
+        mock_create_page.return_value = "test-page-123"
+
+        assert process_single_paper(sample_paper_pair, sample_config) is True
+        monkeypatch.setattr(f"paper_reviewer.main.{attr}", stale_value)
+        assert process_single_paper(sample_paper_pair, sample_config) is True
+
+        # The stale entry must not be served: analysis ran both times
+        assert mock_analyze.call_count == 2
+
+
 class TestProcessSinglePaper:
     """Test process_single_paper function."""
 
@@ -1,6 +1,5 @@
 """Unit tests for PDF finder module."""
 
-import logging
 from pathlib import Path
 
 import pytest
@@ -11,53 +10,35 @@ from paper_reviewer.pdf_finder import find_pdf_in_directory
 class TestFindPdfInDirectory:
     """Test find_pdf_in_directory function."""
 
-    def test_find_single_pdf(self, temp_dir):
+    def test_find_single_pdf(self, pdf_tree_single):
         """Test finding PDF in directory with single PDF."""
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
-
-        result = find_pdf_in_directory(temp_dir)
+        result = find_pdf_in_directory(pdf_tree_single)
 
         assert result is not None
-        assert result == pdf_file
+        assert result == pdf_tree_single / "test.pdf"
         assert result.exists()
 
-    def test_find_pdf_case_insensitive_lower(self, temp_dir):
-        """Test finding PDF with lowercase extension."""
-        pdf_file = temp_dir / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
-
-        result = find_pdf_in_directory(temp_dir)
-
-        assert result is not None
-        assert result.name == "test.pdf"
-
-    def test_find_pdf_case_insensitive_upper(self, temp_dir):
-        """Test finding PDF with uppercase extension."""
-        pdf_file = temp_dir / "test.PDF"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
-
-        result = find_pdf_in_directory(temp_dir)
-
-        assert result is not None
-        assert result.name == "test.PDF"
-
-    def test_find_pdf_case_insensitive_mixed(self, temp_dir):
-        """Test finding PDF with mixed case extension."""
-        pdf_file = temp_dir / "test.Pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
-
-        result = find_pdf_in_directory(temp_dir)
+    @pytest.mark.parametrize(
+        "tree_fixture,expected_name",
+        [
+            ("pdf_tree_single", "test.pdf"),
+            ("pdf_tree_upper", "test.PDF"),
+            ("pdf_tree_mixed", "test.Pdf"),
+        ],
+    )
+    def test_find_pdf_case_insensitive(self, request, tree_fixture, expected_name):
+        """Test finding PDFs across extension case variants."""
+        result = find_pdf_in_directory(request.getfixturevalue(tree_fixture))
 
         assert result is not None
-        assert result.name == "test.Pdf"
+        assert result.name == expected_name
 
     def test_find_pdf_recursive(self, temp_dir):
         """Test finding PDF in subdirectory."""
         subdir = temp_dir / "subdir"
         subdir.mkdir()
         pdf_file = subdir / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
+        pdf_file.touch()
 
         result = find_pdf_in_directory(temp_dir)
 
@@ -65,34 +46,22 @@ class TestFindPdfInDirectory:
         assert result == pdf_file
         assert "subdir" in str(result)
 
-    def test_find_pdf_nested_multiple_levels(self, temp_dir):
+    def test_find_pdf_nested_multiple_levels(self, pdf_tree_nested):
         """Test finding PDF nested multiple levels deep."""
-        level1 = temp_dir / "level1"
-        level2 = level1 / "level2"
-        level2.mkdir(parents=True)
-        pdf_file = level2 / "test.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
-
-        result = find_pdf_in_directory(temp_dir)
+        result = find_pdf_in_directory(pdf_tree_nested)
 
         assert result is not None
-        assert result == pdf_file
+        assert result == pdf_tree_nested / "level1" / "level2" / "test.pdf"
 
-    def test_multiple_pdfs_returns_first(self, temp_dir, caplog):
+    def test_multiple_pdfs_returns_first(self, pdf_tree_multi, warning_records):
         """Test behavior when multiple PDFs exist."""
-        pdf1 = temp_dir / "first.pdf"
-        pdf2 = temp_dir / "second.pdf"
-        pdf1.write_bytes(b"%PDF-1.4\n")
-        pdf2.write_bytes(b"%PDF-1.4\n")
-
-        with caplog.at_level(logging.WARNING):
-            result = find_pdf_in_directory(temp_dir)
+        result = find_pdf_in_directory(pdf_tree_multi)
 
         assert result is not None
         # Should return first one found
-        assert result in [pdf1, pdf2]
+        assert result in [pdf_tree_multi / "first.pdf", pdf_tree_multi / "second.pdf"]
         # Should log warning
-        assert "Multiple PDF files" in caplog.text
+        assert any("Multiple PDF files" in r.getMessage() for r in warning_records)
 
     def test_no_pdf_files(self, temp_dir):
         """Test directory with no PDF files."""
@@ -121,9 +90,9 @@ class TestFindPdfInDirectory:
 
         assert result is None
 
-    def test_empty_directory(self, temp_dir):
+    def test_empty_directory(self, pdf_tree_empty):
         """Test empty directory."""
-        result = find_pdf_in_directory(temp_dir)
+        result = find_pdf_in_directory(pdf_tree_empty)
 
         assert result is None
 
@@ -136,6 +105,22 @@ class TestFindPdfInDirectory:
 
         assert result is None
 
+    def test_hidden_and_tooling_directories_skipped(self, temp_dir):
+        """PDFs inside hidden or tooling directories are not picked up."""
+        hidden = temp_dir / ".hidden"
+        hidden.mkdir()
+        (hidden / "secret.pdf").touch()
+        cache = temp_dir / "__pycache__"
+        cache.mkdir()
+        (cache / "stale.pdf").touch()
+
+        assert find_pdf_in_directory(temp_dir) is None
+
+        # A visible PDF is still found alongside the pruned directories
+        visible = temp_dir / "paper.pdf"
+        visible.touch()
+        assert find_pdf_in_directory(temp_dir) == visible
+
     def test_only_files_not_directories(self, temp_dir):
         """Test that only actual files are returned, not directories."""
         # Create a directory named like a PDF
@@ -147,39 +132,43 @@ class TestFindPdfInDirectory:
         # Should not return the directory
         assert result is None or result.is_file()
 
-    def test_from_fixture_paper1(self):
+    def test_from_fixture_paper1(self, sample_papers_dir, fixture_pdf_cache):
         """Test finding PDF in paper1 fixture."""
-        fixture_dir = Path(__file__).parent / "fixtures" / "sample_papers" / "paper1"
+        fixture_dir = sample_papers_dir / "paper1"
 
-        result = find_pdf_in_directory(fixture_dir)
+        if fixture_dir not in fixture_pdf_cache:
+            fixture_pdf_cache[fixture_dir] = find_pdf_in_directory(fixture_dir)
+        result = fixture_pdf_cache[fixture_dir]
 
         assert result is not None
         assert result.name == "paper1.pdf"
 
-    def test_from_fixture_paper2(self):
+    def test_from_fixture_paper2(self, sample_papers_dir, fixture_pdf_cache):
         """Test finding PDF in paper2 fixture (nested)."""
-        fixture_dir = Path(__file__).parent / "fixtures" / "sample_papers" / "paper2"
+        fixture_dir = sample_papers_dir / "paper2"
 
-        result = find_pdf_in_directory(fixture_dir)
+        if fixture_dir not in fixture_pdf_cache:
+            fixture_pdf_cache[fixture_dir] = find_pdf_in_directory(fixture_dir)
+        result = fixture_pdf_cache[fixture_dir]
 
         assert result is not None
         assert "paper2.PDF" in result.name
 
-    def test_from_fixture_paper3_multiple(self, caplog):
+    def test_from_fixture_paper3_multiple(self, sample_papers_dir, warning_records):
         """Test finding PDF in paper3 fixture with multiple PDFs."""
-        fixture_dir = Path(__file__).parent / "fixtures" / "sample_papers" / "paper3"
+        # Not cached: this test asserts on the warning the walk emits
+        fixture_dir = sample_papers_dir / "paper3"
 
-        with caplog.at_level(logging.WARNING):
-            result = find_pdf_in_directory(fixture_dir)
+        result = find_pdf_in_directory(fixture_dir)
 
         assert result is not None
         assert result.exists()
         # Should log warning about multiple PDFs
-        assert "Multiple PDF files" in caplog.text
+        assert any("Multiple PDF files" in r.getMessage() for r in warning_records)
 
-    def test_from_fixture_empty_dir(self):
+    def test_from_fixture_empty_dir(self, sample_papers_dir):
         """Test finding PDF in empty directory fixture."""
-        fixture_dir = Path(__file__).parent / "fixtures" / "sample_papers" / "empty_dir"
+        fixture_dir = sample_papers_dir / "empty_dir"
 
         result = find_pdf_in_directory(fixture_dir)
 
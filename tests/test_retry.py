@@ -0,0 +1,122 @@
+"""Unit tests for transient-failure retry helpers."""
+
+import pytest
+
+from paper_reviewer.errors import GeminiAPIError, NotionAPIError
+from paper_reviewer.retry import (
+    _is_transient,
+    _retry_after_seconds,
+    retry_transient,
+)
+
+
+def _wrapped(error_cls, **cause_attrs):
+    """Build an API error chained to a cause carrying the given attributes."""
+    cause = Exception("api failure")
+    for name, value in cause_attrs.items():
+        setattr(cause, name, value)
+    exc = error_cls("boom")
+    exc.__cause__ = cause
+    return exc
+
+
+class TestIsTransient:
+    """Test the retry predicate."""
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_transient_http_status(self, status):
+        """Rate-limit and server errors on the cause are retryable."""
+        assert _is_transient(_wrapped(GeminiAPIError, status=status)) is True
+
+    def test_status_code_attribute(self):
+        """httpx-style status_code attributes are recognized too."""
+        assert _is_transient(_wrapped(NotionAPIError, status_code=503)) is True
+
+    @pytest.mark.parametrize("code", ["rate_limited", "service_unavailable"])
+    def test_transient_notion_string_code(self, code):
+        """notion-client surfaces string codes rather than HTTP statuses."""
+        assert _is_transient(_wrapped(NotionAPIError, code=code)) is True
+
+    @pytest.mark.parametrize(
+        "cause_attrs",
+        [
+            {"status": 400},
+            {"status": 404},
+            {"code": "validation_error"},
+            {"status": "not-a-number"},
+        ],
+    )
+    def test_non_transient_cause(self, cause_attrs):
+        """Client errors and unknown codes are not retryable."""
+        assert _is_transient(_wrapped(GeminiAPIError, **cause_attrs)) is False
+
+    def test_no_cause(self):
+        """An API error without a chained cause is not retryable."""
+        assert _is_transient(GeminiAPIError("boom")) is False
+
+    def test_foreign_exception_type(self):
+        """Only our API errors are retried, whatever the cause says."""
+        assert _is_transient(_wrapped(ValueError, status=429)) is False
+
+
+class TestRetryAfterSeconds:
+    """Test Retry-After header extraction."""
+
+    def test_retry_after_header(self):
+        exc = _wrapped(NotionAPIError, headers={"Retry-After": "7"})
+        assert _retry_after_seconds(exc) == 7.0
+
+    def test_lowercase_header(self):
+        exc = _wrapped(NotionAPIError, headers={"retry-after": "1.5"})
+        assert _retry_after_seconds(exc) == 1.5
+
+    def test_unparseable_header(self):
+        exc = _wrapped(NotionAPIError, headers={"Retry-After": "soon"})
+        assert _retry_after_seconds(exc) is None
+
+    def test_no_headers(self):
+        assert _retry_after_seconds(_wrapped(GeminiAPIError, status=429)) is None
+
+
+class TestRetryTransient:
+    """Test the decorator end to end (with sleeping disabled)."""
+
+    def test_retries_until_success(self):
+        calls = []
+
+        @retry_transient
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _wrapped(GeminiAPIError, status=429)
+            return "ok"
+
+        flaky.retry.sleep = lambda _: None
+        assert flaky() == "ok"
+        assert len(calls) == 3
+
+    def test_gives_up_after_five_attempts(self):
+        calls = []
+
+        @retry_transient
+        def always_down():
+            calls.append(1)
+            raise _wrapped(NotionAPIError, code="service_unavailable")
+
+        always_down.retry.sleep = lambda _: None
+        with pytest.raises(NotionAPIError):
+            always_down()
+        assert len(calls) == 5
+
+    def test_non_transient_raises_immediately(self):
+        calls = []
+
+        @retry_transient
+        def bad_request():
+            calls.append(1)
+            raise _wrapped(GeminiAPIError, status=400)
+
+        bad_request.retry.sleep = lambda _: None
+        with pytest.raises(GeminiAPIError):
+            bad_request()
+        assert len(calls) == 1
@@ -0,0 +1,56 @@
+"""Unit tests for UI output batching."""
+
+import pytest
+
+from paper_reviewer import ui
+
+
+@pytest.fixture
+def printed(monkeypatch):
+    """Capture Console.print calls as a list of markup strings."""
+    calls = []
+
+    class _FakeConsole:
+        def print(self, markup):
+            calls.append(markup)
+
+    fake = _FakeConsole()
+    monkeypatch.setattr(ui, "_get_console", lambda: fake)
+    return calls
+
+
+class TestBatchOutput:
+    """Test the batch_output context manager."""
+
+    def test_messages_flush_in_one_print(self, printed):
+        with ui.batch_output():
+            ui.display_success("first")
+            ui.display_error("second")
+            # Nothing rendered while the block is open
+            assert printed == []
+
+        assert len(printed) == 1
+        assert "first" in printed[0]
+        assert "second" in printed[0]
+        assert printed[0].count("\n") == 1
+
+    def test_empty_block_prints_nothing(self, printed):
+        with ui.batch_output():
+            pass
+
+        assert printed == []
+
+    def test_direct_print_outside_block(self, printed):
+        ui.display_info("hello")
+
+        assert len(printed) == 1
+        assert "hello" in printed[0]
+
+    def test_buffer_restored_after_block(self, printed):
+        with ui.batch_output():
+            ui.display_info("inside")
+
+        ui.display_info("outside")
+
+        # One flush for the block, one direct print afterwards
+        assert len(printed) == 2
@@ -11,6 +11,11 @@ from paper_reviewer.zotero_parser import (
 )
 
 
+def _zotero_field(path_str: str) -> str:
+    """Wrap an already-escaped path string in the Zotero file-field format."""
+    return f"{{PDF:{path_str}:application/pdf}}"
+
+
 class TestExtractPdfPathFromFileField:
     """Test extract_pdf_path_from_file_field function."""
 
@@ -24,7 +29,7 @@ class TestExtractPdfPathFromFileField:
         # After bibtexparser, might be C:\\Users\\... (double backslash)
         # We need to handle both
         test_path = str(pdf_file).replace("\\", "\\\\")  # Double backslash for Windows
-        file_field = f"{{PDF:{test_path}:application/pdf}}"
+        file_field = _zotero_field(test_path)
 
         result = extract_pdf_path_from_file_field(file_field)
 
@@ -38,8 +43,7 @@ class TestExtractPdfPathFromFileField:
         pdf_file.write_text("test content")
 
         # Already normalized path
-        test_path = str(pdf_file)
-        file_field = f"{{PDF:{test_path}:application/pdf}}"
+        file_field = _zotero_field(str(pdf_file))
 
         result = extract_pdf_path_from_file_field(file_field)
 
@@ -66,54 +70,31 @@ class TestExtractPdfPathFromFileField:
         assert result is not None
         assert result.exists()
 
-    def test_invalid_format(self):
-        """Test invalid file field format."""
-        file_field = "invalid format"
-        result = extract_pdf_path_from_file_field(file_field)
-        assert result is None
-
-    def test_missing_pdf_prefix(self):
-        """Test file field without PDF prefix."""
-        file_field = "{DOC:/path/to/file.doc:application/msword}"
-        result = extract_pdf_path_from_file_field(file_field)
-        assert result is None
-
-    def test_nonexistent_path(self):
-        """Test with non-existent file path."""
-        file_field = "{PDF:/nonexistent/path/file.pdf:application/pdf}"
-        result = extract_pdf_path_from_file_field(file_field)
-        assert result is None
-
-    def test_empty_string(self):
-        """Test with empty string."""
-        result = extract_pdf_path_from_file_field("")
-        assert result is None
-
-    def test_none_value(self):
-        """Test with None value."""
-        result = extract_pdf_path_from_file_field(None)
-        assert result is None
+    @pytest.mark.parametrize(
+        "file_field",
+        [
+            "invalid format",
+            "{DOC:/path/to/file.doc:application/msword}",
+            "{PDF:/nonexistent/path/file.pdf:application/pdf}",
+            "",
+            None,
+        ],
+        ids=["invalid_format", "missing_pdf_prefix", "nonexistent_path", "empty_string", "none_value"],
+    )
+    def test_invalid_inputs(self, file_field):
+        """Invalid, non-PDF, stale, empty and None file fields all yield None."""
+        assert extract_pdf_path_from_file_field(file_field) is None
 
 
 class TestParseZoteroBibFile:
     """Test parse_zotero_bib_file function."""
 
-    def test_parse_valid_zotero_bib_with_file_field(self, temp_dir):
+    def test_parse_valid_zotero_bib_with_file_field(self, temp_dir, write_zotero_bib):
         """Test parsing Zotero BibTeX file with file field."""
-        # Create test PDF
         pdf_file = temp_dir / "test_paper.pdf"
         pdf_file.write_text("test PDF content")
-
-        # Create BibTeX file with Zotero file field format
-        bib_file = temp_dir / "test.bib"
-        pdf_path_str = str(pdf_file).replace("\\", "\\\\")  # Escape for Windows
-        bib_file.write_text(
-            f"""@article{{test2024,
-  title={{Test Paper Title}},
-  author={{Doe, John}},
-  year={{2024}},
-  file={{PDF:{pdf_path_str}:application/pdf}}
-}}"""
+        bib_file = write_zotero_bib(
+            temp_dir / "test.bib", [("test2024", "Test Paper Title", pdf_file)]
         )
 
         paper_pairs = parse_zotero_bib_file(bib_file)
@@ -125,26 +106,15 @@ class TestParseZoteroBibFile:
         assert paper_pairs[0].pdf_path == pdf_file
         assert paper_pairs[0].pdf_path.exists()
 
-    def test_parse_multiple_entries(self, temp_dir):
+    def test_parse_multiple_entries(self, temp_dir, write_zotero_bib):
         """Test parsing BibTeX file with multiple entries."""
-        # Create test PDFs
         pdf1 = temp_dir / "paper1.pdf"
         pdf1.write_text("content1")
         pdf2 = temp_dir / "paper2.pdf"
         pdf2.write_text("content2")
-
-        bib_file = temp_dir / "test.bib"
-        pdf1_str = str(pdf1).replace("\\", "\\\\")
-        pdf2_str = str(pdf2).replace("\\", "\\\\")
-        bib_file.write_text(
-            f"""@article{{test2024,
-  title={{First Paper}},
-  file={{PDF:{pdf1_str}:application/pdf}}
-}}
-@article{{test2023,
-  title={{Second Paper}},
-  file={{PDF:{pdf2_str}:application/pdf}}
-}}"""
+        bib_file = write_zotero_bib(
+            temp_dir / "test.bib",
+            [("test2024", "First Paper", pdf1), ("test2023", "Second Paper", pdf2)],
         )
 
         paper_pairs = parse_zotero_bib_file(bib_file)
@@ -183,25 +153,17 @@ class TestParseZoteroBibFile:
             parse_zotero_bib_file(bib_file)
         assert "No valid entries with PDF paths" in str(exc_info.value)
 
-    def test_mixed_valid_and_invalid_entries(self, temp_dir):
+    def test_mixed_valid_and_invalid_entries(self, temp_dir, write_zotero_bib):
         """Test file with both valid and invalid entries."""
         pdf_file = temp_dir / "valid.pdf"
         pdf_file.write_text("content")
-
-        bib_file = temp_dir / "test.bib"
-        pdf_str = str(pdf_file).replace("\\", "\\\\")
-        bib_file.write_text(
-            f"""@article{{valid2024,
-  title={{Valid Paper}},
-  file={{PDF:{pdf_str}:application/pdf}}
-}}
-@article{{invalid2024,
-  title={{Invalid Paper}},
-  file={{PDF:/nonexistent/path.pdf:application/pdf}}
-}}
-@article{{no_file2024,
-  title={{No File Paper}}
-}}"""
+        bib_file = write_zotero_bib(
+            temp_dir / "test.bib",
+            [
+                ("valid2024", "Valid Paper", pdf_file),
+                ("invalid2024", "Invalid Paper", "/nonexistent/path.pdf"),
+                ("no_file2024", "No File Paper", None),
+            ],
         )
 
         paper_pairs = parse_zotero_bib_file(bib_file)
@@ -233,25 +195,15 @@ class TestParseZoteroBibFile:
             exc_info.value
         )
 
-    def test_zotero_sample_format(self, temp_dir):
+    def test_zotero_sample_format(self, temp_dir, write_zotero_bib):
         """Test with Zotero sample format (Windows path with escaped backslashes)."""
-        # Create a test PDF
+        # Long Zotero-style attachment filename; the helper escapes the
+        # backslashes the way a real export does
         pdf_file = temp_dir / "Chi et al. - 2024 - Universal Manipulation Interface In-The-Wild Robot Teaching Without In-The-Wild Robots.pdf"
         pdf_file.write_text("test content")
-
-        # Simulate Zotero format: C\:\\Users\\... (with escaped backslashes)
-        # In actual Zotero export, it might be: C\:\\Users\\haoyan.li\\Zotero\\storage\\F8XWENS7\\file.pdf
-        # We'll use the temp_dir path instead
-        pdf_path_str = str(pdf_file).replace("\\", "\\\\")
-        
-        bib_file = temp_dir / "zotero_sample.bib"
-        bib_file.write_text(
-            f"""@inproceedings{{chi_universal_2024,
-	title = {{Universal Manipulation Interface}},
-	author = {{Chi, Cheng}},
-	year = {{2024}},
-	file = {{PDF:{pdf_path_str}:application/pdf}},
-}}"""
+        bib_file = write_zotero_bib(
+            temp_dir / "zotero_sample.bib",
+            [("chi_universal_2024", "Universal Manipulation Interface", pdf_file)],
         )
 
         paper_pairs = parse_zotero_bib_file(bib_file)